@@ -8,9 +8,23 @@ from .models import (
     Invitation,
 )
 
-admin.site.register(Role)
-admin.site.register(Permission)
-admin.site.register(RolePermission)
-admin.site.register(UserCompany)
-admin.site.register(UserCompanyRole)
+
+class SoftDeleteAdmin(admin.ModelAdmin):
+    """Admin listing soft-deleted rows too (the default manager hides them)"""
+
+    list_filter = ("is_deleted",)
+
+    def get_queryset(self, request):
+        qs = self.model.all_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        if ordering:
+            qs = qs.order_by(*ordering)
+        return qs
+
+
+admin.site.register(Role, SoftDeleteAdmin)
+admin.site.register(Permission, SoftDeleteAdmin)
+admin.site.register(RolePermission, SoftDeleteAdmin)
+admin.site.register(UserCompany, SoftDeleteAdmin)
+admin.site.register(UserCompanyRole, SoftDeleteAdmin)
 admin.site.register(Invitation)
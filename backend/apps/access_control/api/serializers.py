@@ -1,5 +1,11 @@
+from functools import cached_property
+from operator import attrgetter
+
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueTogetherValidator
+from django.db import IntegrityError, models, transaction
 from django.utils import timezone
 
 from ..models import (
@@ -10,66 +16,217 @@ from ..models import (
     UserCompany,
     UserCompanyRole,
 )
+from ..cache import get_role_by_pk, get_permission_by_pk
 
 
 # ==================== BASE SERIALIZER MIXINS ====================
 
+def _normalize_text(value, message, lower=False):
+    """Reject empty/blank text and return it stripped (and lower-cased if requested)"""
+    if value is None or not value or value.isspace():
+        raise serializers.ValidationError(message)
+    stripped = value.strip()
+    return stripped.lower() if lower else stripped
+
+
+def _compile_instance_value_reader(field):
+    """Build a reader returning a field's column value from the instance, or from the raw data on create"""
+    attname, name = field.attname, field.name
+
+    def reader(serializer):
+        if serializer.instance is not None:
+            # Read the column from __dict__, skipping the descriptor: for a
+            # foreign key this is the raw *_id, so no related row is loaded
+            values = serializer.instance.__dict__
+            if attname in values:
+                return values[attname]
+            return getattr(serializer.instance, attname)
+        return serializer.initial_data.get(name)
+
+    return reader
+
+
 class SoftDeleteValidationMixin:
     """Mixin to add soft-delete aware validation helpers"""
 
+    _instance_value_fns = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model = getattr(getattr(cls, "Meta", None), "model", None)
+        if model is not None:
+            # Compiled once per serializer class instead of on every validation
+            cls._instance_value_fns = {
+                field.name: _compile_instance_value_reader(field)
+                for field in model._meta.fields
+            }
+
     def get_instance_value(self, field_name):
-        """Get field value from instance if available, otherwise from data"""
-        if self.instance:
-            return getattr(self.instance, field_name, None)
-        # Try to get from initial_data if available (during validation)
-        if hasattr(self, 'initial_data') and self.initial_data:
-            return self.initial_data.get(field_name)
-        return None
+        """
+        Get a field's column value from the instance if available, otherwise from data.
+
+        Foreign keys yield the related primary key, not the related object.
+        """
+        return self._instance_value_fns[field_name](self)
+
+
+class RequestedFieldsMixin:
+    """
+    Limit the serializer to the fields requested with ``?fields=``.
+
+    Views opt in by putting the requested names in ``context["fields"]``
+    (see PartialResponseMixin in the views); unknown names are ignored.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.context.get("fields")
+        if requested:
+            fields = {name: field for name, field in fields.items() if name in requested}
+        return fields
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key field that resolves instances through the RBAC cache"""
+
+    def __init__(self, loader, **kwargs):
+        self.loader = loader
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        instance = self.loader(pk)
+        if instance is None:
+            self.fail("does_not_exist", pk_value=data)
+        return instance
+
+
+class UniqueConstraintErrorMixin:
+    """
+    Mixin enforcing a unique-together rule over the active rows of a model.
+
+    Serializers declare ``unique_together_active_fields`` (and, for models whose
+    default manager does not already hide inactive rows,
+    ``unique_together_active_filter``). Single-object writes skip the SELECT
+    pre-check: the INSERT/UPDATE itself is the check, with the model's unique
+    constraint rejecting duplicates and the violation turned into a validation
+    error. Batches still get a UniqueTogetherValidator so nothing is written
+    when one item conflicts. Any other integrity error (NOT NULL, foreign
+    key, check, or another declared unique constraint) is re-raised untouched.
+    """
+
+    unique_error_message = "A record with these values already exists."
+    unique_together_active_fields = ()
+    unique_together_active_filter = {}
+
+    def get_validators(self):
+        if not self.unique_together_active_fields:
+            return super().get_validators()
+        if not isinstance(self.parent, serializers.ListSerializer):
+            return []
+        return [
+            UniqueTogetherValidator(
+                queryset=self.Meta.model.objects.filter(
+                    **self.unique_together_active_filter
+                ),
+                fields=self.unique_together_active_fields,
+                message=self.unique_error_message,
+            )
+        ]
+
+    @cached_property
+    def unique_constraint_names(self):
+        """Names of the model's unique constraints over the declared fields"""
+        fields = set(self.unique_together_active_fields)
+        return frozenset(
+            constraint.name
+            for constraint in self.Meta.model._meta.constraints
+            if isinstance(constraint, models.UniqueConstraint) and set(constraint.fields) == fields
+        )
 
+    @cached_property
+    def other_constraint_names(self):
+        """Names of the model's other declared constraints"""
+        return frozenset(
+            constraint.name for constraint in self.Meta.model._meta.constraints
+        ) - self.unique_constraint_names
+
+    def is_unique_violation(self, exc):
+        """Whether an IntegrityError is a violation of the declared unique constraint"""
+        cause = exc.__cause__
+        constraint_name = getattr(getattr(cause, "diag", None), "constraint_name", None)
+        if constraint_name in self.unique_constraint_names:
+            return True
+        if constraint_name in self.other_constraint_names:
+            return False
+        # Unnamed (e.g. SQLite in tests) or not declared on the model, like a
+        # unique index left from before the migrations: any unique violation,
+        # but still never NOT NULL / FK / check errors
+        return (
+            getattr(cause, "pgcode", None) == "23505"
+            or getattr(cause, "sqlite_errorname", None) == "SQLITE_CONSTRAINT_UNIQUE"
+        )
 
-class TimestampedFieldsMixin:
-    """Mixin to make timestamp fields read-only"""
+    def unique_error(self):
+        """Build the validation error reported for a unique constraint violation"""
+        fields = self.unique_together_active_fields
+        key = fields[0] if len(fields) == 1 else api_settings.NON_FIELD_ERRORS_KEY
+        return serializers.ValidationError(
+            {key: [self.unique_error_message]}, code="unique"
+        )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Make timestamp fields read-only
-        if self.instance is None:
-            # On create, make created_at and updated_at read-only
-            self.fields.get("created_at", {}).read_only = True
-            self.fields.get("updated_at", {}).read_only = True
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as exc:
+            if not self.is_unique_violation(exc):
+                raise
+            raise self.unique_error()
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            if not self.is_unique_violation(exc):
+                raise
+            raise self.unique_error()
 
 
 # ==================== PERMISSION SERIALIZERS ====================
 
-class PermissionSerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFieldsMixin):
+class PermissionSerializer(UniqueConstraintErrorMixin, ModelSerializer, SoftDeleteValidationMixin):
+    unique_error_message = "Permission code must be unique."
+    unique_together_active_fields = ("code",)
+
     class Meta:
         model = Permission
         fields = "__all__"
         read_only_fields = ("created_at", "updated_at", "deleted_at", "is_deleted")
+        # Uniqueness is enforced by the active unique constraint on save
+        extra_kwargs = {"code": {"validators": []}}
 
     def validate_code(self, value):
         """Validate permission code"""
-        if not value or not (value := value.strip()):
-            raise serializers.ValidationError("Permission code cannot be empty.")
-        
-        # Check uniqueness excluding soft-deleted records
-        qs = Permission.objects.filter(code=value, is_deleted=False)
-        if self.instance:
-            qs = qs.exclude(pk=self.instance.pk)
-        if qs.exists():
-            raise serializers.ValidationError("Permission code must be unique.")
-        return value
+        return _normalize_text(value, "Permission code cannot be empty.")
 
     def validate_module(self, value):
         """Validate module name"""
-        if not value or not (value := value.strip()):
-            raise serializers.ValidationError("Module cannot be empty.")
-        return value
+        return _normalize_text(value, "Module cannot be empty.")
 
 
 # ==================== ROLE SERIALIZERS ====================
 
-class RoleSerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFieldsMixin):
+class RoleSerializer(UniqueConstraintErrorMixin, ModelSerializer, SoftDeleteValidationMixin):
+    unique_error_message = "A role with this name already exists for the company."
+    unique_together_active_fields = ("company", "role")
+
     class Meta:
         model = Role
         fields = "__all__"
@@ -77,113 +234,119 @@ class RoleSerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFiel
 
     def validate_role(self, value):
         """Validate role name"""
-        if not value or not (value := value.strip()):
-            raise serializers.ValidationError("Role name cannot be empty.")
+        value = _normalize_text(value, "Role name cannot be empty.", lower=True)
         if len(value) > 50:
             raise serializers.ValidationError(
                 "Role must be at most 50 characters long."
             )
         return value
 
-    def validate(self, data):
-        """Validate role uniqueness within company"""
-        role_val = data.get("role") or self.get_instance_value("role")
-        company = data.get("company") or self.get_instance_value("company")
-        
-        # Exclude soft-deleted roles when checking for duplicates
-        qs = Role.objects.filter(role=role_val, company=company, is_deleted=False)
-        if self.instance:
-            qs = qs.exclude(pk=self.instance.pk)
-        if qs.exists():
-            raise serializers.ValidationError(
-                {"role": "A role with this name already exists for the company."}
-            )
-        return data
-
 
 # ==================== ROLE PERMISSION SERIALIZERS ====================
 
-class RolePermissionSerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFieldsMixin):
+class RolePermissionSerializer(UniqueConstraintErrorMixin, ModelSerializer, SoftDeleteValidationMixin):
+    unique_error_message = "This role already has the specified permission."
+    unique_together_active_fields = ("role", "permission")
+
+    role = CachedPrimaryKeyRelatedField(
+        loader=get_role_by_pk, queryset=Role.objects.all()
+    )
+    permission = CachedPrimaryKeyRelatedField(
+        loader=get_permission_by_pk, queryset=Permission.objects.all()
+    )
+
     class Meta:
         model = RolePermission
         fields = "__all__"
         read_only_fields = ("created_at", "updated_at", "deleted_at", "is_deleted")
 
-    def validate(self, data):
-        """Validate role-permission uniqueness"""
-        role = data.get("role") or self.get_instance_value("role")
-        permission = data.get("permission") or self.get_instance_value("permission")
-        
-        if not role or not permission:
-            raise serializers.ValidationError("Both role and permission are required.")
-        
-        # Exclude soft-deleted role permissions when checking for duplicates
-        qs = RolePermission.objects.filter(
-            role=role, 
-            permission=permission, 
-            is_deleted=False
+
+class RolePermissionBulkSerializer(serializers.Serializer):
+    """Input for assigning several permissions to one role at once"""
+
+    role = CachedPrimaryKeyRelatedField(
+        loader=get_role_by_pk, queryset=Role.objects.all()
+    )
+    permissions = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+    granted = serializers.BooleanField(default=True)
+
+    def validate_permissions(self, value):
+        """Deduplicate ids and check they all exist, with one query"""
+        permission_ids = list(dict.fromkeys(value))
+        found = set(
+            Permission.objects.filter(pk__in=permission_ids).values_list("id", flat=True)
         )
-        if self.instance:
-            qs = qs.exclude(pk=self.instance.pk)
-        if qs.exists():
-            raise serializers.ValidationError(
-                "This role already has the specified permission."
-            )
-        return data
+        missing = [pk for pk in permission_ids if pk not in found]
+        if missing:
+            raise serializers.ValidationError(f"Invalid permission ids: {missing}")
+        return permission_ids
 
 
 # ==================== USER COMPANY SERIALIZERS ====================
 
-class UserCompanySerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFieldsMixin):
+class UserCompanySerializer(RequestedFieldsMixin, UniqueConstraintErrorMixin, ModelSerializer, SoftDeleteValidationMixin):
+    unique_error_message = "This user is already associated with the company."
+    unique_together_active_fields = ("user", "company")
+
     class Meta:
         model = UserCompany
         fields = "__all__"
         read_only_fields = ("created_at", "updated_at", "deleted_at", "is_deleted", "joined_at")
 
-    def validate(self, data):
-        """Validate user-company uniqueness"""
-        user = data.get("user") or self.get_instance_value("user")
-        company = data.get("company") or self.get_instance_value("company")
-        
-        if not user or not company:
-            raise serializers.ValidationError("Both user and company are required.")
-        
-        # Exclude soft-deleted user-company associations when checking for duplicates
-        qs = UserCompany.objects.filter(user=user, company=company, is_deleted=False)
-        if self.instance:
-            qs = qs.exclude(pk=self.instance.pk)
-        if qs.exists():
-            raise serializers.ValidationError(
-                "This user is already associated with the company."
-            )
-        return data
-
 
 # ==================== USER COMPANY ROLE SERIALIZERS ====================
 
-class UserCompanyRoleSerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFieldsMixin):
+class UserCompanyRoleSerializer(UniqueConstraintErrorMixin, ModelSerializer, SoftDeleteValidationMixin):
     """Serializer for user-company-role assignments"""
-    # Include nested representations for read operations (can be optimized in views)
-    role = RoleSerializer(read_only=True)
-    user_company = UserCompanySerializer(read_only=True)
+    unique_error_message = "This role is already assigned to the user in this company."
+    unique_together_active_fields = ("user_company", "role")
+
+    # Written as primary keys, read back as nested representations
+    role = CachedPrimaryKeyRelatedField(
+        loader=get_role_by_pk, queryset=Role.objects.all()
+    )
+    user_company = serializers.PrimaryKeyRelatedField(queryset=UserCompany.objects.all())
 
     class Meta:
         model = UserCompanyRole
         fields = "__all__"
         read_only_fields = ("created_at", "updated_at", "deleted_at", "is_deleted", "assigned_at")
 
+    @cached_property
+    def nested_serializers(self):
+        """
+        Role and user company serializers, built once and reused for every
+        row (a list serializer shares a single child).
+        """
+        return (
+            RoleSerializer(context=self.context),
+            UserCompanySerializer(context=self.context),
+        )
+
+    def to_representation(self, instance):
+        ret = super().to_representation(instance)
+        role_serializer, user_company_serializer = self.nested_serializers
+        ret["role"] = role_serializer.to_representation(instance.role)
+        ret["user_company"] = user_company_serializer.to_representation(instance.user_company)
+        return ret
+
     def validate(self, data):
         """Validate role belongs to user's company"""
-        role = data.get("role") or self.get_instance_value("role")
-        user_company = data.get("user_company") or self.get_instance_value("user_company")
+        role = data.get("role") or get_role_by_pk(self.get_instance_value("role"))
+        # Detail views select_related the user company, so this is not a query
+        user_company = data.get("user_company") or (
+            self.instance.user_company if self.instance is not None else None
+        )
         
         if not role or not user_company:
             raise serializers.ValidationError(
                 "Both user_company and role are required."
             )
         
-        # Validate role belongs to user's company
-        if role.company is not None and role.company != user_company.company:
+        # Validate role belongs to user's company (compare FK columns, no lookups)
+        if role.company_id is not None and role.company_id != user_company.company_id:
             raise serializers.ValidationError(
                 "Role does not belong to the user's company."
             )
@@ -192,7 +355,15 @@ class UserCompanyRoleSerializer(ModelSerializer, SoftDeleteValidationMixin, Time
 
 # ==================== INVITATION SERIALIZERS ====================
 
-class InvitationSerializer(ModelSerializer, SoftDeleteValidationMixin, TimestampedFieldsMixin):
+class InvitationSerializer(UniqueConstraintErrorMixin, ModelSerializer, SoftDeleteValidationMixin):
+    unique_error_message = "There is already a pending invitation for this email and company."
+    unique_together_active_fields = ("email", "company")
+    unique_together_active_filter = {"status": "pending"}
+
+    role = CachedPrimaryKeyRelatedField(
+        loader=get_role_by_pk, queryset=Role.objects.all()
+    )
+
     class Meta:
         model = Invitation
         fields = "__all__"
@@ -200,87 +371,110 @@ class InvitationSerializer(ModelSerializer, SoftDeleteValidationMixin, Timestamp
 
     def validate_email(self, value):
         """Validate and normalize email"""
-        if not value or not (value := value.strip().lower()):
-            raise serializers.ValidationError("Email is required.")
-        return value
+        return _normalize_text(value, "Email is required.", lower=True)
 
     def validate_expires_at(self, value):
         """Validate expiry is in the future"""
-        if value <= timezone.now():
+        # List views pass a single "now" for the whole request
+        now = self.context.get("now") or timezone.now()
+        if value <= now:
             raise serializers.ValidationError("Expiry must be a future datetime.")
         return value
 
     def validate(self, data):
         """Validate invitation business rules"""
-        company = data.get("company") or self.get_instance_value("company")
-        role = data.get("role") or self.get_instance_value("role")
-        email = data.get("email") or self.get_instance_value("email")
+        company = data.get("company")
+        company_id = company.pk if company else self.get_instance_value("company")
+        role = data.get("role") or get_role_by_pk(self.get_instance_value("role"))
 
-        if not company:
+        if not company_id:
             raise serializers.ValidationError(
                 {"company": "Company is required for an invitation."}
             )
 
         # Validate role belongs to company
-        if role and role.company is not None and role.company != company:
+        if role and role.company_id is not None and role.company_id != company_id:
             raise serializers.ValidationError(
                 {"role": "Selected role does not belong to the target company."}
             )
 
-        # Check for pending invitations (only if creating new invitation)
-        if not self.instance:
-            if Invitation.objects.filter(
-                email=email, 
-                company=company, 
-                status="pending"
-            ).exists():
-                raise serializers.ValidationError(
-                    {
-                        "email": "There is already a pending invitation for this email and company."
-                    }
-                )
-
-        # Token validation (only if token is provided)
-        token = data.get("token")
-        if token:
-            qs = Invitation.objects.filter(token=token)
-            if self.instance:
-                qs = qs.exclude(pk=self.instance.pk)
-            if qs.exists():
-                raise serializers.ValidationError({"token": "Token must be unique."})
-
         return data
 
 
 # ==================== LIST SERIALIZERS (OPTIMIZED FOR LIST VIEWS) ====================
 
-class RoleListSerializer(ModelSerializer):
+class FlatRepresentationMixin:
+    """
+    Lean read path for flat, read-only list serializers.
+
+    The readable fields are resolved once per serializer instance (a list
+    serializer reuses one child for every row) into (name, getter,
+    to_representation) entries. Related primary keys are read from the
+    local *_id column; every other field keeps its own to_representation.
+    """
+
+    def get_field_readers(self):
+        """(name, getter, to_representation or None) for each readable field"""
+        readers = []
+        for field in self._readable_fields:
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+                readers.append((field.field_name, attrgetter(f"{field.source}_id"), None))
+            else:
+                readers.append((field.field_name, field.get_attribute, field.to_representation))
+        return readers
+
+    @classmethod
+    def get_only_fields(cls):
+        """Model fields the representation reads, for QuerySet.only()"""
+        return tuple(
+            field.source or name for name, field in cls._declared_fields.items()
+        )
+
+    def to_representation(self, instance):
+        readers = self.__dict__.get("_field_readers")
+        if readers is None:
+            readers = self._field_readers = self.get_field_readers()
+        ret = {}
+        for name, get, represent in readers:
+            value = get(instance)
+            ret[name] = value if represent is None or value is None else represent(value)
+        return ret
+
+
+class RoleListSerializer(RequestedFieldsMixin, FlatRepresentationMixin, serializers.Serializer):
     """Lightweight serializer for list views"""
-    class Meta:
-        model = Role
-        fields = ("id", "role", "desc", "company", "is_system_role", "created_at")
-        read_only_fields = fields
+    id = serializers.IntegerField(read_only=True)
+    role = serializers.CharField(read_only=True)
+    desc = serializers.CharField(read_only=True)
+    company = serializers.PrimaryKeyRelatedField(read_only=True)
+    is_system_role = serializers.BooleanField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
 
 
-class PermissionListSerializer(ModelSerializer):
+class PermissionListSerializer(RequestedFieldsMixin, FlatRepresentationMixin, serializers.Serializer):
     """Lightweight serializer for list views"""
-    class Meta:
-        model = Permission
-        fields = ("id", "code", "module", "description", "created_at")
-        read_only_fields = fields
+    id = serializers.IntegerField(read_only=True)
+    code = serializers.CharField(read_only=True)
+    module = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
 
 
-class InvitationListSerializer(ModelSerializer):
+class RolePermissionListSerializer(RequestedFieldsMixin, FlatRepresentationMixin, serializers.Serializer):
     """Lightweight serializer for list views"""
-    class Meta:
-        model = Invitation
-        fields = (
-            "id", 
-            "email", 
-            "company", 
-            "role", 
-            "status", 
-            "expires_at", 
-            "created_at"
-        )
-        read_only_fields = fields
+    id = serializers.IntegerField(read_only=True)
+    role = serializers.PrimaryKeyRelatedField(read_only=True)
+    permission = serializers.PrimaryKeyRelatedField(read_only=True)
+    granted = serializers.BooleanField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+class InvitationListSerializer(RequestedFieldsMixin, FlatRepresentationMixin, serializers.Serializer):
+    """Lightweight serializer for list views"""
+    id = serializers.IntegerField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    company = serializers.PrimaryKeyRelatedField(read_only=True)
+    role = serializers.PrimaryKeyRelatedField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    expires_at = serializers.DateTimeField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
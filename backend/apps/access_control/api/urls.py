@@ -9,6 +9,7 @@ from .views import (
     RoleDetailView,
     # RolePermission views
     RolePermissionListCreateView,
+    RolePermissionBulkCreateView,
     RolePermissionDetailView,
     # UserCompany views
     UserCompanyListCreateView,
@@ -35,6 +36,7 @@ urlpatterns = [
 
     # RolePermission endpoints
     path("role-permissions/", RolePermissionListCreateView.as_view(), name="role-permission-list-create"),
+    path("role-permissions/bulk/", RolePermissionBulkCreateView.as_view(), name="role-permission-bulk-create"),
     path("role-permissions/<int:pk>/", RolePermissionDetailView.as_view(), name="role-permission-detail"),
 
     # UserCompany endpoints
@@ -2,8 +2,14 @@
 Access control views using service layer with combined generic views.
 Each URL path maps to exactly one view that dispatches by HTTP method.
 """
+import hashlib
 import logging
+from functools import cached_property
+from django.db.models import Count, Max
 from django.db.models.query import QuerySet
+from django.utils import timezone
+from django.utils.cache import quote_etag
+from django.utils.http import parse_etags
 from rest_framework.views import APIView
 from rest_framework.generics import (
     ListCreateAPIView,
@@ -11,11 +17,13 @@ from rest_framework.generics import (
     RetrieveUpdateAPIView,
 )
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
@@ -27,6 +35,8 @@ from .serializers import (
     RoleSerializer,
     RoleListSerializer,
     RolePermissionSerializer,
+    RolePermissionBulkSerializer,
+    RolePermissionListSerializer,
     UserCompanySerializer,
     UserCompanyRoleSerializer,
     InvitationSerializer,
@@ -42,36 +52,212 @@ from ..services import (
     InvitationService,
 )
 from ..permissions.IsAdminUser import IsAdminUser
+from ..cache import get_permission_list
+from apps.company.models import Company
 from apps.shared.exceptions import BusinessException
+from apps.shared.pagination import CreatedAtCursorPagination
+from apps.shared.renderers import ORJSONRenderer
 
 logger = logging.getLogger(__name__)
 
+# Permission instances are stateless; share them instead of rebuilding per request
+ADMIN_PERMISSIONS = (IsAuthenticated(), IsAdminUser())
+AUTH_PERMISSIONS = (IsAuthenticated(),)
+WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+# ==================== MIXINS ====================
+
+class NarrowDestroyMixin:
+    """
+    Load only the columns a DELETE needs.
+
+    The response body is empty and the soft delete services touch just a
+    few columns, so the object is fetched with ``destroy_only_fields``
+    (foreign keys by field name, loading the *_id column) and no joins.
+    """
+
+    destroy_only_fields = ("id",)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method == "DELETE":
+            queryset = queryset.select_related(None).only(*self.destroy_only_fields)
+        return queryset
+
+
+class QueryParamIntsMixin:
+    """Integer request parameters, parsed once per request"""
+
+    @cached_property
+    def int_params(self):
+        """Query parameters holding a non-negative integer; others are dropped"""
+        return {
+            key: int(value)
+            for key, value in self.request.query_params.items()
+            if value.isdigit()
+        }
+
+    def get_company_id(self):
+        """Company id from the request body, falling back to the query string"""
+        company_id = self.request.data.get("company")
+        if company_id is not None and str(company_id).isdigit():
+            return int(company_id)
+        return self.int_params.get("company")
+
+
+class PartialResponseMixin:
+    """
+    Support ``?fields=a,b`` partial responses on reads.
+
+    The requested names are passed to the serializer (RequestedFieldsMixin
+    drops the other fields) and the queryset loads only the columns the
+    remaining fields read.
+    """
+
+    def get_requested_fields(self):
+        if self.request.method != "GET":
+            return None
+        raw = self.request.query_params.get("fields")
+        if not raw:
+            return None
+        return frozenset(name.strip() for name in raw.split(",") if name.strip()) or None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_requested_fields()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.get_requested_fields():
+            columns = {field.name for field in queryset.model._meta.concrete_fields}
+            only = [
+                field.source
+                for field in self.get_serializer().fields.values()
+                if field.source in columns
+            ]
+            if only:
+                # The cursor paginator reads its ordering columns off the page rows
+                ordering = getattr(self.paginator, "ordering", ())
+                if isinstance(ordering, str):
+                    ordering = (ordering,)
+                only.extend(name.lstrip("-") for name in ordering)
+                queryset = queryset.only(*only)
+        return queryset
+
+
+class ConditionalListMixin:
+    """
+    Answer repeated list GETs with 304 Not Modified.
+
+    The ETag is derived from MAX(updated_at) and COUNT(*) of the filtered
+    queryset (one aggregate query) plus the query string and the rendered
+    format, so a matching If-None-Match skips the page query and
+    serialization entirely.
+    """
+
+    def get_list_etag(self, queryset) -> str:
+        stats = queryset.order_by().aggregate(last=Max("updated_at"), count=Count("pk"))
+        raw = "|".join((
+            str(stats["last"]),
+            str(stats["count"]),
+            self.request.accepted_renderer.format,
+            self.request.META.get("QUERY_STRING", ""),
+        ))
+        return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+    def get_list_etag_and_data(self, if_none_match) -> tuple:
+        """
+        Returns (etag, data); data is None when if_none_match already
+        holds the etag.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        etag = self.get_list_etag(queryset)
+        if etag in if_none_match or "*" in if_none_match:
+            return etag, None
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            data = self.get_paginated_response(self.get_serializer(page, many=True).data).data
+        else:
+            data = self.get_serializer(queryset, many=True).data
+        return etag, data
+
+    def list(self, request, *args, **kwargs):
+        if_none_match = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        etag, data = self.get_list_etag_and_data(if_none_match)
+        if data is None or etag in if_none_match or "*" in if_none_match:
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(data, headers={"ETag": etag})
+
 
 # ==================== PERMISSION VIEWS ====================
 
-class PermissionListCreateView(ListCreateAPIView):
+class PermissionListCreateView(ConditionalListMixin, PartialResponseMixin, ListCreateAPIView):
     """
     GET  /permissions/ → list all permissions (any authenticated user)
     POST /permissions/ → create a new permission (admin only)
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    serializer_classes = {"GET": PermissionListSerializer, "POST": PermissionSerializer}
 
     def get_serializer_class(self):
-        if self.request.method == "GET":
-            return PermissionListSerializer
-        return PermissionSerializer
+        return self.serializer_classes.get(self.request.method, PermissionSerializer)
 
     def get_permissions(self):
-        if self.request.method == "POST":
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
+
+    # Query parameters the list reads; requests carrying others bypass the cache
+    cache_query_params = frozenset({"cursor", "fields", "format"})
+
+    def get_list_cache_key(self):
+        """
+        Cache key built from the normalized parameters the list depends on.
+        
+        Returns:
+            The key, or None when the request carries parameters the list
+            does not read (so junk parameters cannot mint cache entries)
+        """
+        params = self.request.query_params
+        if not params.keys() <= self.cache_query_params or any(
+            len(values) > 1 for _, values in params.lists()
+        ):
+            return None
+        
+        cursor = self.paginator.decode_cursor(self.request)
+        fields = self.get_requested_fields() or ()
+        return "|".join((
+            self.request.accepted_renderer.format,
+            # The host selects the tenant
+            self.request.get_host(),
+            f"{cursor.offset}:{int(cursor.reverse)}:{cursor.position}" if cursor else "",
+            ",".join(sorted(set(fields) & PermissionListSerializer().fields.keys())),
+        ))
+
+    def get_list_etag_and_data(self, if_none_match) -> tuple:
+        key = self.get_list_cache_key()
+        if key is None:
+            return super().get_list_etag_and_data(if_none_match)
+        # Same for every user; the permission cache version is bumped on any
+        # Permission write, so a cached page is never stale
+        return get_permission_list(key, lambda: super(PermissionListCreateView, self).get_list_etag_and_data(()))
 
     def get_queryset(self) -> QuerySet:
-        return PermissionService.get_active_permissions()
+        queryset = PermissionService.get_active_permissions()
+        if self.request.method == "GET":
+            # Only load the columns the list serializer renders
+            queryset = queryset.only(*PermissionListSerializer.get_only_fields())
+        return queryset
 
 
-class PermissionDetailView(RetrieveUpdateDestroyAPIView):
+class PermissionDetailView(NarrowDestroyMixin, RetrieveUpdateDestroyAPIView):
     """
     GET    /permissions/<pk>/ → retrieve (any authenticated user)
     PUT    /permissions/<pk>/ → update (admin only)
@@ -80,12 +266,13 @@ class PermissionDetailView(RetrieveUpdateDestroyAPIView):
     """
 
     serializer_class = PermissionSerializer
+    destroy_only_fields = ("id", "code")
     permission_classes = [IsAuthenticated]
 
     def get_permissions(self):
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self):
         return PermissionService.get_active_permissions()
@@ -96,30 +283,36 @@ class PermissionDetailView(RetrieveUpdateDestroyAPIView):
 
 # ==================== ROLE VIEWS ====================
 
-class RoleListCreateView(ListCreateAPIView):
+class RoleListCreateView(
+    ConditionalListMixin, QueryParamIntsMixin, PartialResponseMixin, ListCreateAPIView
+):
     """
     GET  /roles/ → list roles for user's companies
     POST /roles/ → create a new role (admin only)
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    serializer_classes = {"GET": RoleListSerializer, "POST": RoleSerializer}
 
     def get_serializer_class(self):
-        if self.request.method == "GET":
-            return RoleListSerializer
-        return RoleSerializer
+        return self.serializer_classes.get(self.request.method, RoleSerializer)
 
     def get_permissions(self):
-        if self.request.method == "POST":
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self) -> QuerySet:
-        company_id = self.request.query_params.get("company")
-        return RoleService.get_roles_for_user(
+        queryset = RoleService.get_roles_for_user(
             self.request.user,
-            company_id=int(company_id) if company_id else None,
+            company_id=self.int_params.get("company"),
         )
+        if self.request.method == "GET":
+            queryset = queryset.only(*RoleListSerializer.get_only_fields())
+        return queryset
 
     def create(self, request, *args, **kwargs):
         company_id = request.data.get("company")
@@ -131,7 +324,7 @@ class RoleListCreateView(ListCreateAPIView):
 
         try:
             RoleService.verify_company(company_id)
-        except Exception:
+        except (Company.DoesNotExist, ValueError):
             return Response(
                 {"detail": "Company not found."},
                 status=HTTP_404_NOT_FOUND,
@@ -144,7 +337,7 @@ class RoleListCreateView(ListCreateAPIView):
         return Response(serializer.data, status=HTTP_201_CREATED, headers=headers)
 
 
-class RoleDetailView(RetrieveUpdateDestroyAPIView):
+class RoleDetailView(QueryParamIntsMixin, NarrowDestroyMixin, RetrieveUpdateDestroyAPIView):
     """
     GET    /roles/<pk>/ → retrieve
     PUT    /roles/<pk>/ → update (admin only)
@@ -153,12 +346,13 @@ class RoleDetailView(RetrieveUpdateDestroyAPIView):
     """
 
     serializer_class = RoleSerializer
+    destroy_only_fields = ("id", "company", "role")
     permission_classes = [IsAuthenticated]
 
     def get_permissions(self):
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self):
         return RoleService.get_roles_for_user(self.request.user)
@@ -166,58 +360,66 @@ class RoleDetailView(RetrieveUpdateDestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
 
-        company_id = request.query_params.get("company")
-        if not company_id:
+        if not request.query_params.get("company"):
             return Response(
                 {"detail": "Company is required as query parameter."},
                 status=HTTP_400_BAD_REQUEST,
             )
 
+        company_id = self.int_params.get("company")
+        if company_id is None:
+            return Response(
+                {"detail": "Invalid company ID."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
         try:
-            RoleService.soft_delete_role(instance, company_id=int(company_id))
+            RoleService.soft_delete_role(instance, company_id=company_id)
             return Response(status=HTTP_204_NO_CONTENT)
         except BusinessException as e:
             return Response(
                 {"detail": str(e)},
                 status=HTTP_403_FORBIDDEN,
             )
-        except ValueError:
-            return Response(
-                {"detail": "Invalid company ID."},
-                status=HTTP_400_BAD_REQUEST,
-            )
 
 
 # ==================== ROLE PERMISSION VIEWS ====================
 
-class RolePermissionListCreateView(ListCreateAPIView):
+class RolePermissionListCreateView(QueryParamIntsMixin, PartialResponseMixin, ListCreateAPIView):
     """
     GET  /role-permissions/ → list role permissions
     POST /role-permissions/ → assign permission to role (admin only)
     """
 
-    serializer_class = RolePermissionSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    serializer_classes = {"GET": RolePermissionListSerializer, "POST": RolePermissionSerializer}
+
+    def get_serializer_class(self):
+        return self.serializer_classes.get(self.request.method, RolePermissionSerializer)
 
     def get_permissions(self):
-        if self.request.method == "POST":
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self) -> QuerySet:
-        role_id = self.request.query_params.get("role")
-        return RolePermissionService.get_role_permissions_for_user(
+        queryset = RolePermissionService.get_role_permissions_for_user(
             self.request.user,
-            role_id=int(role_id) if role_id else None,
+            role_id=self.int_params.get("role"),
         )
+        if self.request.method == "GET":
+            queryset = queryset.only(*RolePermissionListSerializer.get_only_fields())
+        return queryset
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         role = serializer.validated_data.get("role")
-        if role and role.company:
-            company_id = role.company.id
+        if role and role.company_id:
+            company_id = role.company_id
             if not request.data.get("company") and not request.query_params.get(
                 "company"
             ):
@@ -228,7 +430,39 @@ class RolePermissionListCreateView(ListCreateAPIView):
         return Response(serializer.data, status=HTTP_201_CREATED, headers=headers)
 
 
-class RolePermissionDetailView(RetrieveUpdateDestroyAPIView):
+class RolePermissionBulkCreateView(QueryParamIntsMixin, APIView):
+    """
+    POST /role-permissions/bulk/ → assign several permissions to a role (admin only)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get_permissions(self):
+        return ADMIN_PERMISSIONS
+
+    def post(self, request):
+        serializer = RolePermissionBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        role = serializer.validated_data["role"]
+        if role.company_id != self.get_company_id():
+            return Response(
+                {"detail": "Role does not belong to the company."},
+                status=HTTP_403_FORBIDDEN,
+            )
+
+        permission_ids = RolePermissionService.bulk_assign_permissions_to_role(
+            role,
+            serializer.validated_data["permissions"],
+            granted=serializer.validated_data["granted"],
+        )
+        return Response(
+            {"role": role.pk, "permissions": permission_ids},
+            status=HTTP_201_CREATED,
+        )
+
+
+class RolePermissionDetailView(NarrowDestroyMixin, RetrieveUpdateDestroyAPIView):
     """
     GET    /role-permissions/<pk>/ → retrieve
     PUT    /role-permissions/<pk>/ → update (admin only)
@@ -237,12 +471,13 @@ class RolePermissionDetailView(RetrieveUpdateDestroyAPIView):
     """
 
     serializer_class = RolePermissionSerializer
+    destroy_only_fields = ("id", "role", "permission")
     permission_classes = [IsAuthenticated]
 
     def get_permissions(self):
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self):
         return RolePermissionService.get_role_permissions_for_user(self.request.user)
@@ -253,7 +488,7 @@ class RolePermissionDetailView(RetrieveUpdateDestroyAPIView):
 
 # ==================== USER COMPANY VIEWS ====================
 
-class UserCompanyListCreateView(ListCreateAPIView):
+class UserCompanyListCreateView(QueryParamIntsMixin, PartialResponseMixin, ListCreateAPIView):
     """
     GET  /user-companies/ → list user-company associations
     POST /user-companies/ → associate user with company (admin only)
@@ -261,30 +496,31 @@ class UserCompanyListCreateView(ListCreateAPIView):
 
     serializer_class = UserCompanySerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
 
     def get_permissions(self):
-        if self.request.method == "POST":
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self) -> QuerySet:
-        user_id = self.request.query_params.get("user")
-        company_id = self.request.query_params.get("company")
+        user_id = self.int_params.get("user")
+        company_id = self.int_params.get("company")
 
         is_admin = UserCompanyService.is_user_admin(self.request.user)
 
-        queryset = UserCompanyService.get_user_companies(
-            self.request.user,
-            filter_by_user=not is_admin,
-        )
-
+        filters = {}
         if is_admin:
             if user_id:
-                queryset = queryset.filter(user_id=user_id)
+                filters["user_id"] = user_id
             if company_id:
-                queryset = queryset.filter(company_id=company_id)
+                filters["company_id"] = company_id
 
-        return queryset
+        return UserCompanyService.get_user_companies(
+            self.request.user,
+            filter_by_user=not is_admin,
+            extra_filters=filters,
+        )
 
     def create(self, request, *args, **kwargs):
         company_id = request.data.get("company")
@@ -301,7 +537,7 @@ class UserCompanyListCreateView(ListCreateAPIView):
         return Response(serializer.data, status=HTTP_201_CREATED, headers=headers)
 
 
-class UserCompanyDetailView(RetrieveUpdateDestroyAPIView):
+class UserCompanyDetailView(NarrowDestroyMixin, RetrieveUpdateDestroyAPIView):
     """
     GET    /user-companies/<pk>/ → retrieve
     PUT    /user-companies/<pk>/ → update (admin only)
@@ -310,12 +546,13 @@ class UserCompanyDetailView(RetrieveUpdateDestroyAPIView):
     """
 
     serializer_class = UserCompanySerializer
+    destroy_only_fields = ("id", "user", "company")
     permission_classes = [IsAuthenticated]
 
     def get_permissions(self):
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self):
         return UserCompanyService.get_user_companies(
@@ -329,7 +566,7 @@ class UserCompanyDetailView(RetrieveUpdateDestroyAPIView):
 
 # ==================== USER COMPANY ROLE VIEWS ====================
 
-class UserCompanyRoleListCreateView(ListCreateAPIView):
+class UserCompanyRoleListCreateView(QueryParamIntsMixin, ListCreateAPIView):
     """
     GET  /user-company-roles/ → list user-company-role assignments
     POST /user-company-roles/ → assign role to user-company (admin only)
@@ -337,20 +574,19 @@ class UserCompanyRoleListCreateView(ListCreateAPIView):
 
     serializer_class = UserCompanyRoleSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
 
     def get_permissions(self):
-        if self.request.method == "POST":
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self) -> QuerySet:
-        user_company_id = self.request.query_params.get("user_company")
-        role_id = self.request.query_params.get("role")
 
         return UserCompanyRoleService.get_user_company_roles_for_user(
             self.request.user,
-            user_company_id=int(user_company_id) if user_company_id else None,
-            role_id=int(role_id) if role_id else None,
+            user_company_id=self.int_params.get("user_company"),
+            role_id=self.int_params.get("role"),
         )
 
     def create(self, request, *args, **kwargs):
@@ -358,8 +594,8 @@ class UserCompanyRoleListCreateView(ListCreateAPIView):
         serializer.is_valid(raise_exception=True)
 
         user_company = serializer.validated_data.get("user_company")
-        if user_company and user_company.company:
-            company_id = user_company.company.id
+        if user_company and user_company.company_id:
+            company_id = user_company.company_id
             if not request.data.get("company") and not request.query_params.get(
                 "company"
             ):
@@ -370,7 +606,7 @@ class UserCompanyRoleListCreateView(ListCreateAPIView):
         return Response(serializer.data, status=HTTP_201_CREATED, headers=headers)
 
 
-class UserCompanyRoleDetailView(RetrieveUpdateDestroyAPIView):
+class UserCompanyRoleDetailView(NarrowDestroyMixin, RetrieveUpdateDestroyAPIView):
     """
     GET    /user-company-roles/<pk>/ → retrieve
     PUT    /user-company-roles/<pk>/ → update (admin only)
@@ -379,15 +615,18 @@ class UserCompanyRoleDetailView(RetrieveUpdateDestroyAPIView):
     """
 
     serializer_class = UserCompanyRoleSerializer
+    destroy_only_fields = ("id", "user_company", "role")
     permission_classes = [IsAuthenticated]
 
     def get_permissions(self):
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self):
-        return UserCompanyRoleService.get_user_company_roles_for_user(self.request.user)
+        return UserCompanyRoleService.get_user_company_roles_for_user(
+            self.request.user
+        )
 
     def perform_destroy(self, instance):
         UserCompanyRoleService.remove_role_from_user(instance)
@@ -395,33 +634,42 @@ class UserCompanyRoleDetailView(RetrieveUpdateDestroyAPIView):
 
 # ==================== INVITATION VIEWS ====================
 
-class InvitationListCreateView(ListCreateAPIView):
+class InvitationListCreateView(QueryParamIntsMixin, PartialResponseMixin, ListCreateAPIView):
     """
     GET  /invitations/ → list invitations
     POST /invitations/ → create invitation (admin only)
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    serializer_classes = {"GET": InvitationListSerializer, "POST": InvitationSerializer}
 
     def get_serializer_class(self):
-        if self.request.method == "GET":
-            return InvitationListSerializer
-        return InvitationSerializer
+        return self.serializer_classes.get(self.request.method, InvitationSerializer)
 
     def get_permissions(self):
-        if self.request.method == "POST":
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["now"] = timezone.now()
+        return context
 
     def get_queryset(self) -> QuerySet:
-        company_id = self.request.query_params.get("company")
         status_filter = self.request.query_params.get("status")
 
-        return InvitationService.get_invitations_for_user(
+        queryset = InvitationService.get_invitations_for_user(
             self.request.user,
-            company_id=int(company_id) if company_id else None,
+            company_id=self.int_params.get("company"),
             status=status_filter,
         )
+        if self.request.method == "GET":
+            queryset = queryset.only(*InvitationListSerializer.get_only_fields())
+        return queryset
 
     def create(self, request, *args, **kwargs):
         company_id = request.data.get("company")
@@ -441,13 +689,11 @@ class InvitationListCreateView(ListCreateAPIView):
                 role=serializer.validated_data["role"],
                 invited_by=request.user,
                 expires_at=serializer.validated_data.get("expires_at"),
-                token=serializer.validated_data.get("token"),
             )
 
-            return Response(
-                InvitationSerializer(invitation).data,
-                status=HTTP_201_CREATED,
-            )
+            # Render with the already validated serializer instead of a new one
+            serializer.instance = invitation
+            return Response(serializer.data, status=HTTP_201_CREATED)
         except BusinessException as e:
             return Response(
                 {"detail": str(e)},
@@ -455,7 +701,7 @@ class InvitationListCreateView(ListCreateAPIView):
             )
 
 
-class InvitationDetailView(RetrieveUpdateDestroyAPIView):
+class InvitationDetailView(NarrowDestroyMixin, RetrieveUpdateDestroyAPIView):
     """
     GET    /invitations/<pk>/ → retrieve
     PUT    /invitations/<pk>/ → update (admin only)
@@ -467,9 +713,9 @@ class InvitationDetailView(RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_permissions(self):
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return [IsAuthenticated(), IsAdminUser()]
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTH_PERMISSIONS
 
     def get_queryset(self):
         return InvitationService.get_invitations_for_user(self.request.user)
@@ -513,43 +759,27 @@ class InvitationAcceptView(APIView):
                 {"detail": str(e)},
                 status=HTTP_400_BAD_REQUEST,
             )
-        except Exception as e:
-            logger.exception("Error accepting invitation")
-            return Response(
-                {"detail": "Invalid or expired invitation token."},
-                status=HTTP_404_NOT_FOUND,
-            )
 
 
-class InvitationRevokeView(APIView):
+class InvitationRevokeView(QueryParamIntsMixin, APIView):
     """Revoke an invitation (Admin only)"""
 
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def post(self, request, pk):
-        try:
-            invitation = InvitationService.get_invitation(pk, user=request.user)
-        except Exception:
-            return Response(
-                {"detail": "Invitation not found."},
-                status=HTTP_404_NOT_FOUND,
-            )
-
-        company_id = request.data.get("company") or request.query_params.get("company")
+        company_id = self.get_company_id()
         if not company_id:
             return Response(
                 {"detail": "Company is required."},
                 status=HTTP_400_BAD_REQUEST,
             )
 
-        if invitation.company.id != int(company_id):
-            return Response(
-                {"detail": "You don't have permission to revoke this invitation."},
-                status=HTTP_403_FORBIDDEN,
-            )
-
         try:
-            InvitationService.revoke_invitation(invitation)
+            if not InvitationService.revoke_invitation(pk, company_id, request.user):
+                return Response(
+                    {"detail": "Invitation not found."},
+                    status=HTTP_404_NOT_FOUND,
+                )
             return Response(
                 {"detail": "Invitation revoked successfully."},
                 status=HTTP_200_OK,
@@ -561,25 +791,26 @@ class InvitationRevokeView(APIView):
             )
 
 
-class InvitationResendView(APIView):
+class InvitationResendView(QueryParamIntsMixin, APIView):
     """Resend an invitation (Admin only)"""
 
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def post(self, request, pk):
-        try:
-            invitation = InvitationService.get_invitation(pk, user=request.user)
-        except Exception:
+        company_id = self.get_company_id()
+        if not company_id:
             return Response(
-                {"detail": "Invitation not found."},
-                status=HTTP_404_NOT_FOUND,
+                {"detail": "You don't have permission to resend this invitation."},
+                status=HTTP_403_FORBIDDEN,
             )
 
-        company_id = request.data.get("company") or request.query_params.get("company")
-        if not company_id or invitation.company.id != int(company_id):
+        invitation = InvitationService.get_invitation_for_company(
+            pk, company_id, request.user
+        )
+        if invitation is None:
             return Response(
-                {"detail": "You don't have permission to resend this invitation."},
-                status=HTTP_403_FORBIDDEN,
+                {"detail": "Invitation not found."},
+                status=HTTP_404_NOT_FOUND,
             )
 
         try:
@@ -0,0 +1,84 @@
+"""
+Access control cache - read-through lookups for rarely changing RBAC rows.
+
+Keys are namespaced by a per-model version (``rbac:v{ver}:role:{pk}``).
+Any write to the model bumps its version (see ``signals.py``), which
+orphans every cached entry for that model at once; stale keys simply
+age out of the cache.
+"""
+from django.core.cache import cache
+
+from .models import Role, Permission, UserCompanyRole
+
+RBAC_CACHE_TIMEOUT = 300
+# Admin membership gates every write; keep it short-lived
+ADMIN_CACHE_TIMEOUT = 60
+# Permission list pages are invalidated exactly by version bumps
+PERMISSION_LIST_CACHE_TIMEOUT = 3600
+
+_MISSING = object()
+
+
+def _version_key(namespace: str) -> str:
+    return f"rbac:version:{namespace}"
+
+
+def get_version(namespace: str) -> int:
+    """Get the current cache version for a namespace"""
+    return cache.get_or_set(_version_key(namespace), 1, None)
+
+
+def bump_version(namespace: str) -> None:
+    """Invalidate every cached entry of a namespace"""
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        cache.set(_version_key(namespace), 2, None)
+
+
+def _cached(namespace: str, ident, loader, timeout: int = RBAC_CACHE_TIMEOUT):
+    key = f"rbac:v{get_version(namespace)}:{namespace}:{ident}"
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = loader()
+        cache.set(key, value, timeout)
+    return value
+
+
+def get_role_by_pk(pk: int):
+    """Get an active role by primary key, or None"""
+    return _cached(
+        "role", pk, lambda: Role.objects.filter(pk=pk).first()
+    )
+
+
+def get_permission_by_pk(pk: int):
+    """Get an active permission by primary key, or None"""
+    return _cached(
+        "permission",
+        pk,
+        lambda: Permission.objects.filter(pk=pk).first(),
+    )
+
+
+def get_permission_list(key: str, loader):
+    """Get a rendered permission list page, computing it with loader on a miss"""
+    return _cached("permission", f"list:{key}", loader, PERMISSION_LIST_CACHE_TIMEOUT)
+
+
+def get_admin_company_ids(user_id: int) -> frozenset:
+    """Get the IDs of the companies a user is an active admin in"""
+    return _cached(
+        "admin",
+        user_id,
+        lambda: frozenset(
+            UserCompanyRole.objects.filter(
+                user_company__user_id=user_id,
+                user_company__is_active=True,
+                user_company__is_deleted=False,
+                # Admin role ids as a subquery instead of joining role
+                role_id__in=Role.objects.filter(role="admin").values("id"),
+            ).values_list("user_company__company_id", flat=True)
+        ),
+        ADMIN_CACHE_TIMEOUT,
+    )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.access_control.services import InvitationService
+
+
+class Command(BaseCommand):
+    help = "Mark overdue pending invitations as expired. Meant to run periodically (cron)."
+
+    def handle(self, *args, **options):
+        count = InvitationService.expire_pending_invitations()
+        self.stdout.write(self.style.SUCCESS(f"Expired {count} invitation(s)."))
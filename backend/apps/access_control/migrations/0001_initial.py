@@ -0,0 +1,152 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('company', '__first__'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Permission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('code', models.CharField(max_length=100, unique=True)),
+                ('module', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Role',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('role', models.CharField(max_length=50)),
+                ('desc', models.TextField(blank=True)),
+                ('is_system_role', models.BooleanField(default=False)),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='roles', to='company.company')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Invitation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(db_index=True, max_length=254)),
+                ('token', models.CharField(max_length=255, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('expired', 'Expired'), ('revoked', 'Revoked')], default='pending', max_length=20)),
+                ('expires_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('accepted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='accepted_invitations', to=settings.AUTH_USER_MODEL)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='invitations', to='company.company')),
+                ('invited_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sent_invitations', to=settings.AUTH_USER_MODEL)),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='access_control.role')),
+            ],
+            options={
+                'verbose_name': 'Company Invitation',
+                'verbose_name_plural': 'Company Invitations',
+                'db_table': 'company_invitations',
+            },
+        ),
+        migrations.CreateModel(
+            name='RolePermission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('granted', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('permission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='access_control.permission')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='access_control.role')),
+            ],
+            options={
+                'verbose_name': 'Role Permission',
+                'verbose_name_plural': 'Role Permissions',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserCompany',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('is_primary_company', models.BooleanField(default=False)),
+                ('joined_at', models.DateTimeField(auto_now_add=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='users', to='company.company')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='companies', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Company',
+                'verbose_name_plural': 'User Companies',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserCompanyRole',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('assigned_at', models.DateTimeField(auto_now_add=True)),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='access_control.role')),
+                ('user_company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='roles', to='access_control.usercompany')),
+            ],
+            options={
+                'verbose_name': 'User Company Role',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['company', 'role'], name='access_cont_company_2fe498_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='role',
+            unique_together={('company', 'role')},
+        ),
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['email'], name='company_inv_email_11128a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['token'], name='company_inv_token_a333e7_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='rolepermission',
+            unique_together={('role', 'permission')},
+        ),
+        migrations.AddIndex(
+            model_name='usercompany',
+            index=models.Index(fields=['user', 'company'], name='access_cont_user_id_48c0f5_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='usercompany',
+            unique_together={('user', 'company')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='usercompanyrole',
+            unique_together={('user_company', 'role')},
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.db.models import Count, Max
+
+
+def revoke_duplicate_pending_invitations(apps, schema_editor):
+    """
+    Keep only the newest pending invitation per (email, company).
+
+    Nothing enforced one pending invitation per email and company before
+    uniq_pending_invitation; older duplicates are revoked so the constraint
+    can be created.
+    """
+    Invitation = apps.get_model("access_control", "Invitation")
+
+    duplicates = (
+        Invitation.objects.filter(status="pending")
+        .values("email", "company_id")
+        .annotate(count=Count("id"), newest=Max("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        Invitation.objects.filter(
+            status="pending",
+            email=duplicate["email"],
+            company_id=duplicate["company_id"],
+            id__lt=duplicate["newest"],
+        ).update(status="revoked")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("access_control", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(revoke_duplicate_pending_invitations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:41
+
+import apps.access_control.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('access_control', '0002_revoke_duplicate_pending_invitations'),
+        ('company', '__first__'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='invitation',
+            name='company_inv_email_11128a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='invitation',
+            name='company_inv_token_a333e7_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='role',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='rolepermission',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='usercompany',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='usercompanyrole',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='invitation',
+            name='token',
+            field=models.CharField(default=apps.access_control.models.generate_invitation_token, editable=False, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='permission',
+            name='code',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['created_at'], name='company_inv_created_983874_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='permission',
+            index=models.Index(fields=['created_at'], name='access_cont_created_af43c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['created_at'], name='access_cont_created_e7a9d5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['role'], name='role_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rolepermission',
+            index=models.Index(fields=['created_at'], name='access_cont_created_48160c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usercompany',
+            index=models.Index(fields=['created_at'], name='access_cont_created_e98504_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usercompanyrole',
+            index=models.Index(fields=['created_at'], name='access_cont_created_83c645_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='invitation',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('email', 'company'), name='uniq_pending_invitation'),
+        ),
+        migrations.AddConstraint(
+            model_name='invitation',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('token',), name='uniq_pending_token'),
+        ),
+        migrations.AddConstraint(
+            model_name='permission',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('code',), name='uniq_active_permission_code'),
+        ),
+        migrations.AddConstraint(
+            model_name='role',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('company', 'role'), name='uniq_active_company_role'),
+        ),
+        migrations.AddConstraint(
+            model_name='rolepermission',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('role', 'permission'), name='uniq_active_role_permission'),
+        ),
+        migrations.AddConstraint(
+            model_name='usercompany',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('user', 'company'), name='uniq_active_user_company'),
+        ),
+        migrations.AddConstraint(
+            model_name='usercompanyrole',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('user_company', 'role'), name='uniq_active_user_company_role'),
+        ),
+    ]
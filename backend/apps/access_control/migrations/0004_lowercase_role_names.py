@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def lowercase_role_names(apps, schema_editor):
+    """
+    Store existing role names the way Role.save() does (stripped, lowercase),
+    so exact-name lookups such as the admin check also match older rows.
+
+    An active role whose normalized name is already taken in its company is
+    left as it is: renaming it would break the unique constraint, and picking
+    which duplicate to retire is an admin decision.
+    """
+    Role = apps.get_model("access_control", "Role")
+
+    taken = {
+        (company_id, role)
+        for company_id, role in Role.objects.filter(is_deleted=False).values_list("company_id", "role")
+    }
+    for pk, company_id, role, is_deleted in Role.objects.values_list(
+        "pk", "company_id", "role", "is_deleted"
+    ).iterator():
+        normalized = role.strip().lower()
+        if normalized == role:
+            continue
+        if not is_deleted and company_id is not None:
+            if (company_id, normalized) in taken:
+                continue
+            taken.add((company_id, normalized))
+        Role.objects.filter(pk=pk).update(role=normalized)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("access_control", "0003_active_row_constraints"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_role_names, migrations.RunPython.noop),
+    ]
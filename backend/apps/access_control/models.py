@@ -1,20 +1,37 @@
+import uuid
 from datetime import timedelta
 
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from apps.identity.account.models import CustomUser
-from apps.core.models import TimeStampedModel, SoftDeleteModel
+from apps.core.models import TimeStampedModel, SoftDeleteModel, ActiveManager
 from apps.company.models import Company
 
 
 class Permission(TimeStampedModel, SoftDeleteModel):
-    code = models.CharField(max_length=100, unique=True)
+    code = models.CharField(max_length=100)
     module = models.CharField(max_length=100)
     description = models.TextField(blank=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["code"],
+                condition=Q(is_deleted=False),
+                name="uniq_active_permission_code",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
+
     def __str__(self):
         return self.code
 
@@ -27,15 +44,32 @@ class Role(TimeStampedModel, SoftDeleteModel):
     desc = models.TextField(blank=True)
     is_system_role = models.BooleanField(default=False)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
-        unique_together = ("company", "role")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["company", "role"],
+                condition=Q(is_deleted=False),
+                name="uniq_active_company_role",
+            ),
+        ]
         indexes = [
             models.Index(fields=["company", "role"]),
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["role"], condition=Q(is_deleted=False), name="role_name_idx"),
         ]
 
     def __str__(self):
         return f"{self.company} - {self.role}"
 
+    def save(self, *args, **kwargs):
+        # Names are stored lowercase so lookups can be exact and indexed
+        if self.role:
+            self.role = self.role.strip().lower()
+        super().save(*args, **kwargs)
+
 
 class RolePermission(TimeStampedModel, SoftDeleteModel):
     role = models.ForeignKey(Role, on_delete=models.CASCADE)
@@ -43,8 +77,20 @@ class RolePermission(TimeStampedModel, SoftDeleteModel):
     granted = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
-        unique_together = ("role", "permission")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["role", "permission"],
+                condition=Q(is_deleted=False),
+                name="uniq_active_role_permission",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
         verbose_name = "Role Permission"
         verbose_name_plural = "Role Permissions"
 
@@ -62,10 +108,20 @@ class UserCompany(TimeStampedModel, SoftDeleteModel):
     joined_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
-        unique_together = ("user", "company")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "company"],
+                condition=Q(is_deleted=False),
+                name="uniq_active_user_company",
+            ),
+        ]
         indexes = [
             models.Index(fields=["user", "company"]),
+            models.Index(fields=["created_at"]),
         ]
         verbose_name = "User Company"
         verbose_name_plural = "User Companies"
@@ -84,14 +140,31 @@ class UserCompanyRole(TimeStampedModel, SoftDeleteModel):
     )
     assigned_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
-        unique_together = ("user_company", "role")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user_company", "role"],
+                condition=Q(is_deleted=False),
+                name="uniq_active_user_company_role",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
         verbose_name = "User Company Role"
 
     def __str__(self) -> str:
         return f"{self.user_company} | {self.role}"
 
 
+def generate_invitation_token() -> str:
+    """A new invitation token: a random UUID4 in its canonical text form"""
+    return str(uuid.uuid4())
+
+
 class Invitation(models.Model):
 
     STATUS_CHOICES = (
@@ -108,7 +181,8 @@ class Invitation(models.Model):
     email = models.EmailField(db_index=True)
     role = models.ForeignKey(Role, on_delete=models.PROTECT)
 
-    token = models.CharField(max_length=255, unique=True)
+    # Kept as text: rows issued before UUID tokens hold other formats
+    token = models.CharField(max_length=255, default=generate_invitation_token, editable=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
 
     expires_at = models.DateTimeField()
@@ -134,9 +208,21 @@ class Invitation(models.Model):
         db_table = "company_invitations"
         verbose_name = _("Company Invitation")
         verbose_name_plural = _("Company Invitations")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email", "company"],
+                condition=Q(status="pending"),
+                name="uniq_pending_invitation",
+            ),
+            # Tokens are only looked up while pending; index just those rows
+            models.UniqueConstraint(
+                fields=["token"],
+                condition=Q(status="pending"),
+                name="uniq_pending_token",
+            ),
+        ]
         indexes = [
-            models.Index(fields=["email"]),
-            models.Index(fields=["token"]),
+            models.Index(fields=["created_at"]),
         ]
 
     def __str__(self):
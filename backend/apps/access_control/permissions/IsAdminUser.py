@@ -1,8 +1,14 @@
+import logging
+
+from django.db import DatabaseError
 from rest_framework.permissions import BasePermission
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
-from ..models import UserCompanyRole, UserCompany, Role
+from ..services.user_company_service import UserCompanyService
+
+logger = logging.getLogger(__name__)
+
 
 class IsAdminUser(BasePermission):
     message = "You're not Authorized"
@@ -18,29 +24,16 @@ class IsAdminUser(BasePermission):
         # Check both request body (POST) and query params (DELETE)
         company_id = request.data.get("company") or request.query_params.get("company")
 
-        # Early return if company_id is missing
-        if not company_id:
+        # Early return if company_id is missing or malformed (branch, not try/except)
+        if not company_id or not str(company_id).isdigit():
             return False
+        company_id = int(company_id)
 
-        print(
-            "user_company", 
-            UserCompany.objects.filter(user=request.user),
-        )
-
-        print("user_company_role", UserCompanyRole.objects.filter(user_company__user=request.user.id, user_company__company=int(company_id)))
-        print("role", Role.objects.filter(role__iexact="admin", is_deleted=False))
+        logger.debug("admin check user=%s company=%s", request.user.id, company_id)
 
         try:
-            is_admin = UserCompanyRole.objects.filter(
-                user_company__user=request.user,
-                user_company__company=int(company_id),
-                user_company__is_active=True,  # Check if UserCompany is active
-                user_company__is_deleted=False,  # Filter soft-deleted UserCompany
-                role__role__iexact="admin",  # Case-insensitive role check
-                role__is_deleted=False,  # Filter soft-deleted Role
-                is_deleted=False,  # Filter soft-deleted UserCompanyRole
-            ).exists()
-            return is_admin
-        except Exception:
-            # Return False on any error (database, etc.)
+            # One query for all of the user's admin companies, memoized on the user
+            return company_id in UserCompanyService.get_admin_company_ids(request.user)
+        except DatabaseError:
+            # Deny access if the lookup fails
             return False
@@ -2,11 +2,14 @@
 Invitation Service - Handles company invitations
 """
 import logging
-import secrets
+import uuid
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from django.db.models import QuerySet
-from apps.shared.services.email_service import send_email
-from ..models import Invitation, UserCompany, UserCompanyRole
+from apps.shared.services.email_service import send_email_async
+from ..models import Invitation, UserCompany, UserCompanyRole, generate_invitation_token
+from ..cache import bump_version
+from .user_company_service import UserCompanyService
 from apps.identity.account.models import CustomUser
 from apps.company.models import Company
 from apps.shared.exceptions import BusinessException
@@ -18,15 +21,6 @@ logger = logging.getLogger(__name__)
 class InvitationService:
     """Service for invitation operations"""
 
-    @staticmethod
-    def get_user_company_ids(user) -> QuerySet:
-        """Get active company IDs for a user"""
-        return UserCompany.objects.filter(
-            user=user,
-            is_active=True,
-            is_deleted=False
-        ).values_list("company_id", flat=True)
-
     @staticmethod
     def get_invitations_for_user(user, company_id: int = None, status: str = None) -> QuerySet:
         """
@@ -40,16 +34,13 @@ class InvitationService:
         Returns:
             QuerySet of Invitation instances
         """
-        user_companies = InvitationService.get_user_company_ids(user)
-        
-        queryset = Invitation.objects.filter(company_id__in=user_companies)
-        
+        filters = {"company_id__in": UserCompanyService.active_company_id_subquery(user)}
         if company_id:
-            queryset = queryset.filter(company_id=company_id)
+            filters["company_id"] = company_id
         if status:
-            queryset = queryset.filter(status=status)
+            filters["status"] = status
         
-        return queryset.order_by("-created_at")
+        return Invitation.objects.filter(**filters).order_by("-created_at")
 
     @staticmethod
     def get_invitation(pk: int, user=None) -> Invitation:
@@ -63,24 +54,45 @@ class InvitationService:
         Returns:
             Invitation instance
         """
-        invitation = Invitation.objects.get(pk=pk)
+        if not user:
+            return Invitation.objects.get(pk=pk)
         
-        # Verify user has access if provided
-        if user:
-            user_companies = InvitationService.get_user_company_ids(user)
-            if invitation.company_id not in user_companies:
-                raise BusinessException("You don't have access to this invitation.")
+        # Access flag is computed in the same query as the fetch
+        invitation = Invitation.objects.annotate(
+            _has_access=UserCompanyService.company_access_exists(user)
+        ).get(pk=pk)
+        if not invitation._has_access:
+            raise BusinessException("You don't have access to this invitation.")
         
         return invitation
 
+    @staticmethod
+    def get_invitation_for_company(pk: int, company_id: int, user) -> Invitation:
+        """
+        Get an invitation of a company the user belongs to, in a single query.
+        
+        Args:
+            pk: Invitation primary key
+            company_id: Company the invitation must belong to
+            user: User whose companies scope the lookup
+            
+        Returns:
+            Invitation instance, or None if not found or not accessible
+        """
+        # Company is joined for the resend email
+        return Invitation.objects.select_related("company").filter(
+            pk=pk,
+            company_id=company_id,
+            company_id__in=UserCompanyService.active_company_id_subquery(user),
+        ).first()
+
     @staticmethod
     def create_invitation(
         company: Company,
         email: str,
         role,
         invited_by: CustomUser,
-        expires_at=None,
-        token: str = None
+        expires_at=None
     ) -> Invitation:
         """
         Create a new invitation.
@@ -91,48 +103,87 @@ class InvitationService:
             role: Role instance
             invited_by: User creating the invitation
             expires_at: Optional expiry datetime
-            token: Optional token (generated if not provided)
             
         Returns:
             Created Invitation instance
         """
         # Validate role belongs to company
-        if role.company is not None and role.company != company:
+        if role.company_id is not None and role.company_id != company.pk:
             raise BusinessException("Selected role does not belong to the target company.")
         
-        # Check for existing pending invitation
-        if Invitation.objects.filter(email=email, company=company, status="pending").exists():
-            raise BusinessException("There is already a pending invitation for this email and company.")
-        
-        if not token:
-            token = secrets.token_urlsafe(32)
-        
         if not expires_at:
             expires_at = Invitation.default_expiry()
         
-        invitation = Invitation.objects.create(
-            company=company,
-            email=email.lower().strip(),
-            role=role,
-            token=token,
-            expires_at=expires_at,
-            invited_by=invited_by
+        # The pending (email, company) unique constraint rejects duplicates,
+        # race-free and without a pre-insert lookup
+        try:
+            with transaction.atomic():
+                invitation = Invitation.objects.create(
+                    company=company,
+                    email=email.lower().strip(),
+                    role=role,
+                    expires_at=expires_at,
+                    invited_by=invited_by
+                )
+        except IntegrityError as exc:
+            if not InvitationService.is_pending_duplicate(exc):
+                raise
+            raise BusinessException("There is already a pending invitation for this email and company.")
+        
+        logger.info("Invitation created for %s to company %s", email, company.pk)
+
+        InvitationService.send_invitation_email(invitation)
+        return invitation
+
+    @staticmethod
+    def is_pending_duplicate(exc: IntegrityError) -> bool:
+        """
+        Whether an IntegrityError is a violation of uniq_pending_invitation.
+        
+        Backends that do not report constraint names (SQLite in tests) match
+        any unique violation; NOT NULL, FK and check errors never match.
+        """
+        cause = exc.__cause__
+        constraint_name = getattr(getattr(cause, "diag", None), "constraint_name", None)
+        if constraint_name:
+            return constraint_name == "uniq_pending_invitation"
+        return (
+            getattr(cause, "pgcode", None) == "23505"
+            or getattr(cause, "sqlite_errorname", None) == "SQLITE_CONSTRAINT_UNIQUE"
         )
+
+    @staticmethod
+    def send_invitation_email(invitation: Invitation) -> None:
+        """
+        Email the invitation link, after commit and off the request thread.
         
-        logger.info(f"Invitation created for {email} to company {company.name}")
+        Args:
+            invitation: Invitation instance to send
+        """
+        invite_link = f"{settings.FRONTEND_URL}/invite/{invitation.token}"
 
-        # send invitation email
-        invite_link = f"{settings.FRONTEND_URL}/invite/{token}"
+        send_email_async(
+            subject="You're invited to join a company",
+            message=f"You have been invited to join {invitation.company.name}. Click the link: {invite_link}",
+            recipient_email=invitation.email
+        )
 
+    @staticmethod
+    def normalize_token(token) -> str:
+        """
+        Canonical form of a UUID invitation token.
+        
+        Args:
+            token: Token as submitted or stored
+            
+        Returns:
+            The token as a lowercase, hyphenated UUID string, or None if it
+            is not a UUID (e.g. a token issued before UUID tokens)
+        """
         try:
-            send_email(
-                subject="You're invited to join a company",
-                message=f"You have been invited to join {company.name}. Click the link: {invite_link}",
-                recipient_email=email
-            )
-        except Exception as e:
-            logger.error(f"Failed to send invitation email to {email}: {e}")
-        return invitation
+            return str(uuid.UUID(str(token)))
+        except ValueError:
+            return None
 
     @staticmethod
     def accept_invitation(token: str, user: CustomUser) -> tuple[UserCompany, UserCompanyRole]:
@@ -149,8 +200,14 @@ class InvitationService:
         Raises:
             BusinessException: If invitation is invalid or expired
         """
+        # Tokens issued before UUID tokens are matched exactly as stored
+        token = InvitationService.normalize_token(token) or token
+        
         try:
-            invitation = Invitation.objects.get(token=token, status="pending")
+            # Company and role are both used below: join them up front
+            invitation = Invitation.objects.select_related("company", "role").get(
+                token=token, status="pending"
+            )
         except Invitation.DoesNotExist:
             raise BusinessException("Invalid or expired invitation token.")
         
@@ -163,50 +220,99 @@ class InvitationService:
         if user.email.lower() != invitation.email.lower():
             raise BusinessException("Invitation email does not match your account email.")
         
-        # Create or reactivate UserCompany association
-        from ..services.user_company_service import UserCompanyService
-        user_company = UserCompanyService.associate_user_with_company(
-            user=user,
-            company=invitation.company
-        )
-        
-        # Assign role
         from ..services.user_company_role_service import UserCompanyRoleService
-        user_company_role = UserCompanyRoleService.assign_role_to_user(
-            user_company=user_company,
-            role=invitation.role
-        )
         
-        # Update invitation status
+        with transaction.atomic():
+            # Claim the invitation with a conditional UPDATE: of concurrent
+            # accepts only one matches the pending row, and a failure below
+            # rolls the claim back
+            claimed = Invitation.objects.filter(
+                pk=invitation.pk, status="pending", expires_at__gt=timezone.now()
+            ).update(status="accepted", accepted_by=user)
+            if not claimed:
+                raise BusinessException("Invalid or expired invitation token.")
+            
+            # Create or reactivate UserCompany association
+            user_company = UserCompanyService.associate_user_with_company(
+                user=user,
+                company=invitation.company
+            )
+            
+            # Assign role
+            user_company_role = UserCompanyRoleService.assign_role_to_user(
+                user_company=user_company,
+                role=invitation.role
+            )
+        
+        # update() skips post_save, so invalidate the cache here
+        bump_version("invitation")
         invitation.status = "accepted"
         invitation.accepted_by = user
-        invitation.save()
         
-        logger.info(f"Invitation accepted by {user.email} for company {invitation.company.name}")
+        logger.info("Invitation accepted by %s for company %s", user.email, invitation.company_id)
         return user_company, user_company_role
 
     @staticmethod
-    def revoke_invitation(invitation: Invitation) -> None:
+    def expire_pending_invitations(company_ids=None) -> int:
+        """
+        Mark every overdue pending invitation as expired in one UPDATE.
+        
+        Args:
+            company_ids: Optional company IDs to restrict the update to
+            
+        Returns:
+            Number of invitations expired
+        """
+        queryset = Invitation.objects.filter(status="pending", expires_at__lt=timezone.now())
+        if company_ids is not None:
+            queryset = queryset.filter(company_id__in=company_ids)
+        
+        count = queryset.update(status="expired")
+        if count:
+            # update() skips post_save, so invalidate the cache here
+            bump_version("invitation")
+            logger.info("%s pending invitations expired", count)
+        return count
+
+    @staticmethod
+    def revoke_invitation(pk: int, company_id: int, user) -> bool:
         """
-        Revoke an invitation.
+        Revoke a pending invitation with a single conditional UPDATE.
         
         Args:
-            invitation: Invitation instance to revoke
+            pk: Invitation primary key
+            company_id: Company the invitation must belong to
+            user: User whose companies scope the lookup
+            
+        Returns:
+            True if revoked, False if not found or not accessible
             
         Raises:
             BusinessException: If invitation cannot be revoked
         """
-        if invitation.status != "pending":
-            raise BusinessException(f"Cannot revoke invitation with status '{invitation.status}'.")
+        revoked = Invitation.objects.filter(
+            pk=pk,
+            company_id=company_id,
+            company_id__in=UserCompanyService.active_company_id_subquery(user),
+            status="pending",
+        ).update(status="revoked")
+        
+        if revoked:
+            # update() skips post_save, so invalidate the cache here
+            bump_version("invitation")
+            logger.info("Invitation revoked: %s", pk)
+            return True
         
-        invitation.status = "revoked"
-        invitation.save()
-        logger.info(f"Invitation revoked: {invitation.email}")
+        # Only failures pay for a read, to tell "missing" from "not pending"
+        invitation = InvitationService.get_invitation_for_company(pk, company_id, user)
+        if invitation is None:
+            return False
+        raise BusinessException(f"Cannot revoke invitation with status '{invitation.status}'.")
 
     @staticmethod
     def resend_invitation(invitation: Invitation) -> Invitation:
         """
-        Resend an invitation (extends expiry).
+        Resend an invitation (extends expiry, re-issues pre-UUID tokens).
         
         Args:
             invitation: Invitation instance to resend
@@ -221,7 +327,13 @@ class InvitationService:
             raise BusinessException(f"Cannot resend invitation with status '{invitation.status}'.")
         
         invitation.expires_at = Invitation.default_expiry()
-        invitation.save()
+        update_fields = ["expires_at"]
+        # Tokens from before UUID tokens can no longer be accepted: re-issue
+        if InvitationService.normalize_token(invitation.token) != invitation.token:
+            invitation.token = generate_invitation_token()
+            update_fields.append("token")
+        invitation.save(update_fields=update_fields)
         
-        logger.info(f"Invitation resent: {invitation.email}")
+        InvitationService.send_invitation_email(invitation)
+        logger.info("Invitation resent: %s", invitation.email)
         return invitation
@@ -6,6 +6,7 @@ from django.utils import timezone
 from django.db.models import QuerySet
 
 from ..models import Permission
+from ..cache import bump_version
 from apps.shared.exceptions import BusinessException
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,7 @@ class PermissionService:
     @staticmethod
     def get_active_permissions() -> QuerySet:
         """Get all non-deleted permissions"""
-        return Permission.objects.filter(is_deleted=False).order_by("code")
+        return Permission.objects.all().order_by("code")
 
     @staticmethod
     def get_permission(pk: int) -> Permission:
@@ -33,7 +34,7 @@ class PermissionService:
         Raises:
             Permission.DoesNotExist: If permission not found
         """
-        return Permission.objects.get(pk=pk, is_deleted=False)
+        return Permission.objects.get(pk=pk)
 
     @staticmethod
     def create_permission(code: str, module: str, description: str = "") -> Permission:
@@ -53,7 +54,7 @@ class PermissionService:
             module=module,
             description=description
         )
-        logger.info(f"Permission created: {code}")
+        logger.info("Permission created: %s", code)
         return permission
 
     @staticmethod
@@ -71,7 +72,7 @@ class PermissionService:
         for key, value in kwargs.items():
             setattr(permission, key, value)
         permission.save()
-        logger.info(f"Permission updated: {permission.code}")
+        logger.info("Permission updated: %s", permission.code)
         return permission
 
     @staticmethod
@@ -82,7 +83,10 @@ class PermissionService:
         Args:
             permission: Permission instance to delete
         """
-        permission.deleted_at = timezone.now()
-        permission.is_deleted = True
-        permission.save()
-        logger.info(f"Permission soft deleted: {permission.code}")
+        # Two-column UPDATE instead of a full-row save
+        Permission.objects.filter(pk=permission.pk).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        # update() skips post_save, so invalidate the cache here
+        bump_version("permission")
+        logger.info("Permission soft deleted: %s", permission.code)
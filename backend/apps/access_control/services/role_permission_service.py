@@ -5,7 +5,8 @@ import logging
 from django.utils import timezone
 from django.db.models import QuerySet
 
-from ..models import RolePermission, Role, Permission, UserCompany
+from ..models import RolePermission, Role, Permission
+from .user_company_service import UserCompanyService
 from apps.shared.exceptions import BusinessException
 
 logger = logging.getLogger(__name__)
@@ -14,15 +15,6 @@ logger = logging.getLogger(__name__)
 class RolePermissionService:
     """Service for role-permission operations"""
 
-    @staticmethod
-    def get_user_company_ids(user) -> QuerySet:
-        """Get active company IDs for a user"""
-        return UserCompany.objects.filter(
-            user=user,
-            is_active=True,
-            is_deleted=False
-        ).values_list("company_id", flat=True)
-
     @staticmethod
     def get_role_permissions_for_user(user, role_id: int = None) -> QuerySet:
         """
@@ -35,18 +27,14 @@ class RolePermissionService:
         Returns:
             QuerySet of RolePermission instances
         """
-        user_companies = RolePermissionService.get_user_company_ids(user)
-        
-        queryset = RolePermission.objects.filter(
-            role__company__in=user_companies,
-            is_deleted=False,
-            role__is_deleted=False
-        )
-        
+        filters = {
+            "role__company__in": UserCompanyService.active_company_id_subquery(user),
+            "role__is_deleted": False,
+        }
         if role_id:
-            queryset = queryset.filter(role_id=role_id, role__is_deleted=False)
+            filters["role_id"] = role_id
         
-        return queryset
+        return RolePermission.objects.filter(**filters)
 
     @staticmethod
     def get_role_permission(pk: int, user=None) -> RolePermission:
@@ -60,17 +48,17 @@ class RolePermissionService:
         Returns:
             RolePermission instance
         """
-        role_permission = RolePermission.objects.get(
-            pk=pk,
-            is_deleted=False,
-            role__is_deleted=False
-        )
-        
-        # Verify user has access if provided
+        queryset = RolePermission.objects.select_related("role")
         if user:
-            user_companies = RolePermissionService.get_user_company_ids(user)
-            if role_permission.role.company_id not in user_companies:
-                raise BusinessException("You don't have access to this role permission.")
+            # Access flag is computed in the same query as the fetch
+            queryset = queryset.annotate(
+                _has_access=UserCompanyService.company_access_exists(user, "role__company_id")
+            )
+        
+        role_permission = queryset.get(pk=pk, role__is_deleted=False)
+        
+        if user and not role_permission._has_access:
+            raise BusinessException("You don't have access to this role permission.")
         
         return role_permission
 
@@ -87,20 +75,54 @@ class RolePermissionService:
         Returns:
             Created RolePermission instance
         """
+        # Uniqueness only covers active rows, so a removed assignment is
+        # simply re-created next to its soft-deleted history. Each remove and
+        # re-assign cycle therefore keeps one more history row for the pair.
         role_permission, created = RolePermission.objects.get_or_create(
             role=role,
             permission=permission,
-            defaults={"granted": granted, "is_deleted": False}
+            defaults={"granted": granted}
         )
         
-        if not created and role_permission.is_deleted:
-            role_permission.is_deleted = False
-            role_permission.granted = granted
-            role_permission.save()
-        
-        logger.info(f"Permission {permission.code} assigned to role {role.role}")
+        logger.info("Permission %s assigned to role %s", permission.code, role.role)
         return role_permission
 
+    @staticmethod
+    def bulk_assign_permissions_to_role(role: Role, permission_ids: list, granted: bool = True) -> list:
+        """
+        Assign several permissions to a role with a single INSERT.
+        
+        Permissions the role already has are left unchanged.
+        
+        Args:
+            role: Role instance
+            permission_ids: IDs of existing permissions
+            granted: Whether permissions are granted
+            
+        Returns:
+            List of the newly assigned permission IDs
+        """
+        assigned = set(
+            RolePermission.objects.filter(
+                role=role, permission_id__in=permission_ids
+            ).values_list("permission_id", flat=True)
+        )
+        new_ids = [pk for pk in permission_ids if pk not in assigned]
+        if not new_ids:
+            return []
+        
+        # Conflicts are still ignored in case a concurrent request won the race
+        RolePermission.objects.bulk_create(
+            [
+                RolePermission(role=role, permission_id=permission_id, granted=granted)
+                for permission_id in new_ids
+            ],
+            ignore_conflicts=True,
+        )
+        
+        logger.info("%s permissions assigned to role %s", len(new_ids), role.role)
+        return new_ids
+
     @staticmethod
     def update_role_permission(role_permission: RolePermission, granted: bool = None) -> RolePermission:
         """
@@ -116,7 +138,7 @@ class RolePermissionService:
         if granted is not None:
             role_permission.granted = granted
         role_permission.save()
-        logger.info(f"Role permission updated: {role_permission}")
+        logger.info("Role permission updated: %s", role_permission.pk)
         return role_permission
 
     @staticmethod
@@ -127,7 +149,28 @@ class RolePermissionService:
         Args:
             role_permission: RolePermission instance to remove
         """
-        role_permission.deleted_at = timezone.now()
-        role_permission.is_deleted = True
-        role_permission.save()
-        logger.info(f"Permission removed from role: {role_permission}")
+        # Two-column UPDATE instead of a full-row save
+        RolePermission.objects.filter(pk=role_permission.pk).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        logger.info(
+            "Permission %s removed from role %s", role_permission.permission_id, role_permission.role_id
+        )
+
+    @staticmethod
+    def remove_all_for_role(role_id: int) -> int:
+        """
+        Remove every permission from a role (soft delete) in one UPDATE.
+        
+        Args:
+            role_id: Role primary key
+            
+        Returns:
+            Number of role-permissions removed
+        """
+        # The active manager already restricts this to is_deleted=False
+        count = RolePermission.objects.filter(role_id=role_id).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        logger.info("%s permissions removed from role %s", count, role_id)
+        return count
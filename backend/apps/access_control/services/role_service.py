@@ -5,7 +5,9 @@ import logging
 from django.utils import timezone
 from django.db.models import QuerySet
 
-from ..models import Role, UserCompany
+from ..models import Role
+from ..cache import bump_version
+from .user_company_service import UserCompanyService
 from apps.company.models import Company
 from apps.shared.exceptions import BusinessException
 
@@ -15,23 +17,6 @@ logger = logging.getLogger(__name__)
 class RoleService:
     """Service for role operations"""
 
-    @staticmethod
-    def get_user_company_ids(user) -> QuerySet:
-        """
-        Get active company IDs for a user.
-        
-        Args:
-            user: User instance
-            
-        Returns:
-            QuerySet of company IDs
-        """
-        return UserCompany.objects.filter(
-            user=user,
-            is_active=True,
-            is_deleted=False
-        ).values_list("company_id", flat=True)
-
     @staticmethod
     def get_roles_for_user(user, company_id: int = None) -> QuerySet:
         """
@@ -44,17 +29,11 @@ class RoleService:
         Returns:
             QuerySet of Role instances
         """
-        user_companies = RoleService.get_user_company_ids(user)
-        
-        queryset = Role.objects.filter(
-            company__in=user_companies,
-            is_deleted=False
-        )
-        
+        filters = {"company__in": UserCompanyService.active_company_id_subquery(user)}
         if company_id:
-            queryset = queryset.filter(company_id=company_id)
+            filters["company_id"] = company_id
         
-        return queryset.order_by("role")
+        return Role.objects.filter(**filters).order_by("role")
 
     @staticmethod
     def get_role(pk: int, user=None) -> Role:
@@ -71,13 +50,15 @@ class RoleService:
         Raises:
             Role.DoesNotExist: If role not found
         """
-        role = Role.objects.get(pk=pk, is_deleted=False)
+        if not user:
+            return Role.objects.get(pk=pk)
         
-        # Verify user has access if provided
-        if user:
-            user_companies = RoleService.get_user_company_ids(user)
-            if role.company_id not in user_companies:
-                raise BusinessException("You don't have access to this role.")
+        # Access flag is computed in the same query as the fetch
+        role = Role.objects.annotate(
+            _has_access=UserCompanyService.company_access_exists(user)
+        ).get(pk=pk)
+        if not role._has_access:
+            raise BusinessException("You don't have access to this role.")
         
         return role
 
@@ -122,7 +103,7 @@ class RoleService:
             is_system_role=is_system_role
         )
         
-        logger.info(f"Role created: {role} for company: {company_id}")
+        logger.info("Role created: %s for company: %s", role, company_id)
         return role_instance
 
     @staticmethod
@@ -144,7 +125,7 @@ class RoleService:
         for key, value in kwargs.items():
             setattr(role, key, value)
         role.save()
-        logger.info(f"Role updated: {role.role}")
+        logger.info("Role updated: %s", role.role)
         return role
 
     @staticmethod
@@ -160,14 +141,16 @@ class RoleService:
             BusinessException: If trying to delete system role or invalid company
         """
         # Prevent deletion of system roles
-        if role.company is None:
+        if role.company_id is None:
             raise BusinessException("Cannot delete system roles.")
         
         # Verify company if provided
-        if company_id and role.company.id != company_id:
+        if company_id and role.company_id != company_id:
             raise BusinessException("Role not found for this company.")
         
-        role.deleted_at = timezone.now()
-        role.is_deleted = True
-        role.save()
-        logger.info(f"Role soft deleted: {role.role}")
+        # Two-column UPDATE instead of a full-row save
+        Role.objects.filter(pk=role.pk).update(is_deleted=True, deleted_at=timezone.now())
+        # update() skips post_save, so invalidate the cache here
+        bump_version("role")
+        bump_version("admin")
+        logger.info("Role soft deleted: %s", role.role)
@@ -6,6 +6,7 @@ from django.utils import timezone
 from django.db.models import QuerySet
 
 from ..models import UserCompanyRole, UserCompany, Role
+from ..cache import bump_version
 from apps.shared.exceptions import BusinessException
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,6 @@ class UserCompanyRoleService:
         return UserCompany.objects.filter(
             user=user,
             is_active=True,
-            is_deleted=False
         ).values_list("id", flat=True)
 
     @staticmethod
@@ -36,22 +36,18 @@ class UserCompanyRoleService:
         Returns:
             QuerySet of UserCompanyRole instances
         """
-        user_companies = UserCompanyRoleService.get_user_company_ids(user)
-        
-        queryset = UserCompanyRole.objects.filter(
-            user_company__in=user_companies,
-            is_deleted=False,
-            user_company__is_deleted=False,
-            user_company__is_active=True,
-            role__is_deleted=False
-        )
-        
+        filters = {
+            "user_company__in": UserCompanyRoleService.get_user_company_ids(user),
+            "user_company__is_deleted": False,
+            "user_company__is_active": True,
+            "role__is_deleted": False,
+        }
         if user_company_id:
-            queryset = queryset.filter(user_company_id=user_company_id)
+            filters["user_company_id"] = user_company_id
         if role_id:
-            queryset = queryset.filter(role_id=role_id)
+            filters["role_id"] = role_id
         
-        return queryset
+        return UserCompanyRole.objects.filter(**filters).select_related("role", "user_company")
 
     @staticmethod
     def get_user_company_role(pk: int, user=None) -> UserCompanyRole:
@@ -65,19 +61,19 @@ class UserCompanyRoleService:
         Returns:
             UserCompanyRole instance
         """
-        user_company_role = UserCompanyRole.objects.get(
-            pk=pk,
-            is_deleted=False,
-            user_company__is_deleted=False,
-            user_company__is_active=True,
-            role__is_deleted=False
-        )
+        # Plain pk lookup; the joined rows are validated in Python below
+        user_company_role = UserCompanyRole.objects.select_related(
+            "role", "user_company"
+        ).get(pk=pk)
         
-        # Verify user has access if provided
-        if user:
-            user_companies = UserCompanyRoleService.get_user_company_ids(user)
-            if user_company_role.user_company_id not in user_companies:
-                raise BusinessException("You don't have access to this assignment.")
+        user_company = user_company_role.user_company
+        if user_company.is_deleted or not user_company.is_active or user_company_role.role.is_deleted:
+            raise UserCompanyRole.DoesNotExist("UserCompanyRole matching query does not exist.")
+        
+        # The user_company is active at this point, so owning it is the
+        # whole access check
+        if user and user_company.user_id != user.pk:
+            raise BusinessException("You don't have access to this assignment.")
         
         return user_company_role
 
@@ -94,20 +90,21 @@ class UserCompanyRoleService:
             Created UserCompanyRole instance
         """
         # Validate role belongs to user's company
-        if role.company is not None and role.company != user_company.company:
+        if role.company_id is not None and role.company_id != user_company.company_id:
             raise BusinessException("Role does not belong to the user's company.")
         
+        # Uniqueness only covers active rows, so a removed assignment is
+        # re-created next to its soft-deleted history (there may be several)
         user_company_role, created = UserCompanyRole.objects.get_or_create(
             user_company=user_company,
             role=role,
-            defaults={"is_deleted": False}
         )
         
-        if not created and user_company_role.is_deleted:
-            user_company_role.is_deleted = False
-            user_company_role.save()
+        # A fetched row does not carry the instances we already hold
+        user_company_role.user_company = user_company
+        user_company_role.role = role
         
-        logger.info(f"Role {role.role} assigned to user {user_company.user.primary_mobile} in company {user_company.company.name}")
+        logger.info("Role %s assigned to user_company_id=%s", role.pk, user_company.pk)
         return user_company_role
 
     @staticmethod
@@ -118,7 +115,33 @@ class UserCompanyRoleService:
         Args:
             user_company_role: UserCompanyRole instance to remove
         """
-        user_company_role.deleted_at = timezone.now()
-        user_company_role.is_deleted = True
-        user_company_role.save()
-        logger.info(f"Role removed from user: {user_company_role}")
+        # Two-column UPDATE instead of a full-row save
+        UserCompanyRole.objects.filter(pk=user_company_role.pk).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        # update() skips post_save, so invalidate the cache here
+        bump_version("admin")
+        logger.info(
+            "Role %s removed from user company %s", user_company_role.role_id, user_company_role.user_company_id
+        )
+
+    @staticmethod
+    def remove_all_for_user_company(user_company_id: int) -> int:
+        """
+        Remove every role from a user in a company (soft delete) in one UPDATE.
+        
+        Args:
+            user_company_id: UserCompany primary key
+            
+        Returns:
+            Number of user-company-roles removed
+        """
+        # The active manager already restricts this to is_deleted=False
+        count = UserCompanyRole.objects.filter(user_company_id=user_company_id).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        if count:
+            # update() skips post_save, so invalidate the cache here
+            bump_version("admin")
+        logger.info("%s roles removed from user company %s", count, user_company_id)
+        return count
@@ -3,9 +3,10 @@ User Company Service - Handles user-company associations
 """
 import logging
 from django.utils import timezone
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 
 from ..models import UserCompany, UserCompanyRole
+from ..cache import get_admin_company_ids
 from apps.identity.account.models import CustomUser
 from apps.company.models import Company
 from apps.shared.exceptions import BusinessException
@@ -16,6 +17,69 @@ logger = logging.getLogger(__name__)
 class UserCompanyService:
     """Service for user-company operations"""
 
+    @staticmethod
+    def active_company_id_subquery(user) -> QuerySet:
+        """
+        Get the IDs of the companies a user is an active member of.
+        
+        Used as ``company_id__in=...`` it compiles into the outer query as
+        a subquery, so it costs no round-trip of its own.
+        
+        Args:
+            user: User instance
+            
+        Returns:
+            QuerySet of company IDs
+        """
+        return UserCompany.objects.filter(
+            user=user,
+            is_active=True,
+        ).values_list("company_id", flat=True)
+
+    @staticmethod
+    def company_access_exists(user, company_ref: str = "company_id") -> Exists:
+        """
+        Build an EXISTS flag telling whether the user is an active member
+        of the company referenced by the outer row.
+        
+        Annotated onto a lookup, the access check arrives with the fetched
+        row instead of needing a query of its own.
+        
+        Args:
+            user: User instance
+            company_ref: Outer-query path to the company ID
+            
+        Returns:
+            Exists expression
+        """
+        return Exists(
+            UserCompany.objects.filter(
+                user=user,
+                company_id=OuterRef(company_ref),
+                is_active=True,
+            )
+        )
+
+    @staticmethod
+    def get_admin_company_ids(user) -> frozenset:
+        """
+        Get the IDs of every company the user is admin in.
+
+        Read through the shared admin cache (one query on a miss) and
+        memoized on the user object, which lives for a single request, so
+        all admin checks within a request share it.
+        
+        Args:
+            user: User instance
+            
+        Returns:
+            Frozenset of company IDs
+        """
+        company_ids = getattr(user, "_admin_company_ids", None)
+        if company_ids is None:
+            company_ids = user._admin_company_ids = get_admin_company_ids(user.pk)
+        return company_ids
+
     @staticmethod
     def is_user_admin(user) -> bool:
         """
@@ -27,33 +91,27 @@ class UserCompanyService:
         Returns:
             True if user is admin, False otherwise
         """
-        return UserCompanyRole.objects.filter(
-            user_company__user=user,
-            user_company__is_active=True,
-            user_company__is_deleted=False,
-            role__role__iexact="admin",
-            role__is_deleted=False,
-            is_deleted=False
-        ).exists()
+        return bool(UserCompanyService.get_admin_company_ids(user))
 
     @staticmethod
-    def get_user_companies(user, filter_by_user: bool = True) -> QuerySet:
+    def get_user_companies(user, filter_by_user: bool = True, extra_filters: dict = None) -> QuerySet:
         """
         Get user-company associations.
         
         Args:
             user: User instance
             filter_by_user: If True, only return associations for this user
+            extra_filters: Optional field lookups applied in the same filter
             
         Returns:
             QuerySet of UserCompany instances
         """
-        queryset = UserCompany.objects.filter(is_deleted=False)
+        filters = {"is_active": True, **(extra_filters or {})}
         
         if filter_by_user and not UserCompanyService.is_user_admin(user):
-            queryset = queryset.filter(user=user)
+            filters["user"] = user
         
-        return queryset.filter(is_active=True)
+        return UserCompany.objects.filter(**filters)
 
     @staticmethod
     def get_user_company(pk: int, user=None) -> UserCompany:
@@ -67,7 +125,7 @@ class UserCompanyService:
         Returns:
             UserCompany instance
         """
-        user_company = UserCompany.objects.get(pk=pk, is_deleted=False)
+        user_company = UserCompany.objects.get(pk=pk)
         
         # Verify user has access if provided
         if user and not UserCompanyService.is_user_admin(user):
@@ -89,22 +147,22 @@ class UserCompanyService:
         Returns:
             Created UserCompany instance
         """
+        # Uniqueness only covers active rows, so a removed association is
+        # re-created next to its soft-deleted history (there may be several)
         user_company, created = UserCompany.objects.get_or_create(
             user=user,
             company=company,
             defaults={
                 "is_primary_company": is_primary,
                 "is_active": True,
-                "is_deleted": False
             }
         )
         
-        if not created and user_company.is_deleted:
-            user_company.is_deleted = False
-            user_company.is_active = True
-            user_company.save()
+        # A fetched row does not carry the instances we already hold
+        user_company.user = user
+        user_company.company = company
         
-        logger.info(f"User {user.primary_mobile} associated with company {company.name}")
+        logger.info("User %s associated with company %s", user.pk, company.pk)
         return user_company
 
     @staticmethod
@@ -122,7 +180,7 @@ class UserCompanyService:
         for key, value in kwargs.items():
             setattr(user_company, key, value)
         user_company.save()
-        logger.info(f"UserCompany updated: {user_company}")
+        logger.info("UserCompany updated: %s", user_company.pk)
         return user_company
 
     @staticmethod
@@ -137,4 +195,6 @@ class UserCompanyService:
         user_company.is_deleted = True
         user_company.is_active = False
         user_company.save()
-        logger.info(f"User removed from company: {user_company}")
+        logger.info(
+            "User %s removed from company %s", user_company.user_id, user_company.company_id
+        )
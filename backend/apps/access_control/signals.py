@@ -0,0 +1,30 @@
+"""
+Access control signals - keep the RBAC cache coherent with writes.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import bump_version
+from .models import Role, Permission, Invitation, UserCompany, UserCompanyRole
+
+
+@receiver([post_save, post_delete], sender=Role)
+def invalidate_role_cache(sender, **kwargs):
+    bump_version("role")
+    bump_version("admin")
+
+
+@receiver([post_save, post_delete], sender=UserCompany)
+@receiver([post_save, post_delete], sender=UserCompanyRole)
+def invalidate_admin_cache(sender, **kwargs):
+    bump_version("admin")
+
+
+@receiver([post_save, post_delete], sender=Permission)
+def invalidate_permission_cache(sender, **kwargs):
+    bump_version("permission")
+
+
+@receiver([post_save, post_delete], sender=Invitation)
+def invalidate_invitation_cache(sender, **kwargs):
+    bump_version("invitation")
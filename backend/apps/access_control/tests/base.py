@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from apps.identity.account.models import CustomUser
+from apps.company.models import Company
+from ..models import Role, UserCompany, UserCompanyRole
+
+
+class AccessControlAPITestCase(APITestCase):
+    """Company with an authenticated admin member, shared by the API tests"""
+
+    def setUp(self):
+        # RBAC lookups are cached; rolled back rows must not be served from it
+        cache.clear()
+        self.admin = CustomUser.objects.create(
+            username="admin", primary_mobile="+201000000001", email="admin@example.com", account_uid="U1"
+        )
+        self.member = CustomUser.objects.create(
+            username="member", primary_mobile="+201000000002", email="member@example.com", account_uid="U2"
+        )
+        self.company = Company.objects.create(name="Acme", create_by=self.admin)
+        self.admin_role = Role.objects.create(company=self.company, role="admin")
+        self.admin_user_company = UserCompany.objects.create(user=self.admin, company=self.company)
+        UserCompanyRole.objects.create(user_company=self.admin_user_company, role=self.admin_role)
+        self.client.force_authenticate(self.admin)
@@ -0,0 +1,100 @@
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.shared.exceptions import BusinessException
+from ..models import Invitation, UserCompanyRole
+from ..services.invitation_service import InvitationService
+from .base import AccessControlAPITestCase
+from .test_serializers import integrity_error
+
+
+class InvitationAPITestCase(AccessControlAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.invitation = Invitation.objects.create(
+            company=self.company,
+            email=self.member.email,
+            role=self.admin_role,
+            invited_by=self.admin,
+            expires_at=Invitation.default_expiry(),
+        )
+        self.member_client = APIClient()
+        self.member_client.force_authenticate(self.member)
+        self.accept_url = reverse("invitation-accept")
+
+    def accept(self, token):
+        return self.member_client.post(self.accept_url, {"token": token}, format="json")
+
+    def test_new_tokens_are_canonical_uuids(self):
+        self.assertEqual(str(uuid.UUID(self.invitation.token)), self.invitation.token)
+
+    def test_accept(self):
+        response = self.accept(self.invitation.token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.invitation.refresh_from_db()
+        self.assertEqual(self.invitation.status, "accepted")
+        self.assertEqual(self.invitation.accepted_by, self.member)
+
+    def test_accept_normalizes_token_format(self):
+        response = self.accept(self.invitation.token.upper())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_malformed_token_is_rejected(self):
+        response = self.accept("not-a-token")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_accept_pre_uuid_token(self):
+        Invitation.objects.filter(pk=self.invitation.pk).update(token="legacy-urlsafe-token_Ab1")
+
+        self.assertEqual(self.accept("legacy-urlsafe-token_Ab1").status_code, status.HTTP_200_OK)
+
+    def test_resend_reissues_pre_uuid_token(self):
+        Invitation.objects.filter(pk=self.invitation.pk).update(token="legacy-urlsafe-token")
+        self.invitation.refresh_from_db()
+
+        InvitationService.resend_invitation(self.invitation)
+
+        self.assertNotEqual(self.invitation.token, "legacy-urlsafe-token")
+        self.assertEqual(self.accept(self.invitation.token).status_code, status.HTTP_200_OK)
+
+    def test_second_accept_is_rejected(self):
+        self.assertEqual(self.accept(self.invitation.token).status_code, status.HTTP_200_OK)
+
+        response = self.accept(self.invitation.token)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(UserCompanyRole.objects.filter(user_company__user=self.member).count(), 1)
+
+    def test_concurrent_accept_claims_once(self):
+        def accepted_elsewhere(invitation):
+            # Another request accepts between this one's read and its claim
+            Invitation.objects.filter(pk=invitation.pk).update(status="accepted", accepted_by=self.member)
+            return False
+
+        with mock.patch.object(Invitation, "is_expired", autospec=True, side_effect=accepted_elsewhere):
+            with self.assertRaises(BusinessException):
+                InvitationService.accept_invitation(self.invitation.token, self.member)
+
+        self.assertFalse(UserCompanyRole.objects.filter(user_company__user=self.member).exists())
+
+    def test_duplicate_pending_invitation_is_a_business_error(self):
+        with self.assertRaisesMessage(BusinessException, "already a pending invitation"):
+            InvitationService.create_invitation(self.company, self.member.email, self.admin_role, self.admin)
+
+    def test_only_the_pending_constraint_counts_as_duplicate(self):
+        def violation(constraint_name, pgcode="23505"):
+            return integrity_error(pgcode=pgcode, diag=SimpleNamespace(constraint_name=constraint_name))
+
+        self.assertTrue(InvitationService.is_pending_duplicate(violation("uniq_pending_invitation")))
+        self.assertFalse(InvitationService.is_pending_duplicate(violation("uniq_pending_token")))
+        self.assertFalse(InvitationService.is_pending_duplicate(violation("company_invitations_token_key")))
+        self.assertFalse(InvitationService.is_pending_duplicate(violation(None, pgcode="23503")))
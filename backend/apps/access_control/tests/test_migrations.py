@@ -0,0 +1,102 @@
+from datetime import timedelta
+from importlib import import_module
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.loader import MigrationLoader
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.company.models import Company
+from apps.identity.account.models import CustomUser
+from ..models import Invitation, Permission, Role
+
+BASELINE = ("access_control", "0001_initial")
+MIGRATION = ("access_control", "0004_lowercase_role_names")
+lowercase_role_names = import_module(
+    "apps.access_control.migrations.0004_lowercase_role_names"
+).lowercase_role_names
+
+
+class LowercaseRoleNamesTestCase(TestCase):
+
+    def setUp(self):
+        owner = CustomUser.objects.create(
+            username="owner", primary_mobile="+201000000020", email="owner@example.com", account_uid="M1"
+        )
+        self.company = Company.objects.create(name="Legacy", create_by=owner)
+        # Historical models, as the migration sees them
+        self.apps = MigrationLoader(connection).project_state(MIGRATION).apps
+
+    def legacy_role(self, name, **kwargs):
+        # bulk_create skips Role.save(), like rows written before it normalized names
+        return Role.all_objects.bulk_create([Role(company=self.company, role=name, **kwargs)])[0]
+
+    def test_names_are_stripped_and_lowercased(self):
+        role = self.legacy_role(" Admin ")
+
+        lowercase_role_names(self.apps, None)
+
+        role.refresh_from_db()
+        self.assertEqual(role.role, "admin")
+
+    def test_active_duplicate_is_left_unchanged(self):
+        self.legacy_role("admin")
+        duplicate = self.legacy_role("Admin")
+        removed = self.legacy_role("ADMIN", is_deleted=True)
+
+        lowercase_role_names(self.apps, None)
+
+        duplicate.refresh_from_db()
+        removed.refresh_from_db()
+        self.assertEqual(duplicate.role, "Admin")
+        self.assertEqual(removed.role, "admin")
+
+
+class BaselineUpgradeTestCase(TransactionTestCase):
+    """A database created from the pre-migration schema upgrades in place"""
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        self.latest = executor.loader.graph.leaf_nodes("access_control")
+        executor.migrate([BASELINE])
+        self.apps = executor.loader.project_state(BASELINE).apps
+
+        owner = CustomUser.objects.create(
+            username="owner", primary_mobile="+201000000020", email="owner@example.com", account_uid="M1"
+        )
+        self.company = Company.objects.create(name="Legacy", create_by=owner)
+
+    def tearDown(self):
+        MigrationExecutor(connection).migrate(self.latest)
+
+    def migrate_to_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.latest)
+
+    def test_soft_deleted_rows_no_longer_block_new_ones(self):
+        LegacyPermission = self.apps.get_model("access_control", "Permission")
+        LegacyPermission.objects.create(code="reports.view", module="reports", is_deleted=True)
+
+        self.migrate_to_latest()
+
+        Permission.objects.create(code="reports.view", module="reports")
+        self.assertEqual(Permission.all_objects.filter(code="reports.view").count(), 2)
+
+    def test_duplicate_pending_invitations_keep_the_newest(self):
+        LegacyRole = self.apps.get_model("access_control", "Role")
+        LegacyInvitation = self.apps.get_model("access_control", "Invitation")
+        role = LegacyRole.objects.create(company_id=self.company.pk, role="member")
+        expires_at = timezone.now() + timedelta(days=1)
+        older, newer = (
+            LegacyInvitation.objects.create(
+                company_id=self.company.pk, email="new@example.com", role=role,
+                token=token, expires_at=expires_at,
+            )
+            for token in ("legacy-1", "legacy-2")
+        )
+
+        self.migrate_to_latest()
+
+        self.assertEqual(Invitation.objects.get(pk=older.pk).status, "revoked")
+        self.assertEqual(Invitation.objects.get(pk=newer.pk).status, "pending")
@@ -0,0 +1,80 @@
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Permission
+from .base import AccessControlAPITestCase
+
+
+class PermissionListCacheTestCase(AccessControlAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        Permission.objects.create(code="role.read", module="role")
+        self.url = reverse("permission-list-create")
+
+    def test_repeated_list_is_served_from_cache(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.data, first.data)
+
+    def test_field_order_does_not_change_the_key(self):
+        self.client.get(self.url, {"fields": "id,code"})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"fields": "code,id,code"})
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "code"})
+
+    def test_unknown_parameters_bypass_the_cache(self):
+        self.client.get(self.url, {"junk": "1"})
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"junk": "1"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_write_invalidates_cached_list(self):
+        self.client.get(self.url)
+        Permission.objects.create(code="role.write", module="role")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data["results"]), 2)
+
+
+class ConditionalListTestCase(AccessControlAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        Permission.objects.create(code="role.read", module="role")
+
+    def test_matching_etag_returns_not_modified(self):
+        for url in (reverse("permission-list-create"), reverse("role-list-create")):
+            with self.subTest(url):
+                etag = self.client.get(url)["ETag"]
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response["ETag"], etag)
+                self.assertFalse(response.content)
+
+    def test_write_changes_the_etag(self):
+        url = reverse("permission-list-create")
+        etag = self.client.get(url)["ETag"]
+        Permission.objects.create(code="role.write", module="role")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_stale_etag_returns_the_list(self):
+        response = self.client.get(reverse("role-list-create"), HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
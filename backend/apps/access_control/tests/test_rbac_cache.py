@@ -0,0 +1,52 @@
+from django.urls import reverse
+from rest_framework import status
+
+from apps.identity.account.models import CustomUser
+from ..cache import get_role_by_pk
+from ..models import UserCompany, UserCompanyRole
+from ..services import RoleService, UserCompanyRoleService
+from .base import AccessControlAPITestCase
+
+
+class RBACCacheInvalidationTestCase(AccessControlAPITestCase):
+    """Admin checks and role lookups are cached; every RBAC write must show up at once"""
+
+    def create_role(self, user, name):
+        # A fresh user object per request, as authentication would load it
+        self.client.force_authenticate(CustomUser.objects.get(pk=user.pk))
+        return self.client.post(
+            reverse("role-list-create"), {"company": self.company.pk, "role": name}, format="json"
+        )
+
+    def test_removed_admin_role_revokes_access(self):
+        self.assertEqual(self.create_role(self.admin, "editor").status_code, status.HTTP_201_CREATED)
+
+        UserCompanyRoleService.remove_role_from_user(
+            UserCompanyRole.objects.get(user_company=self.admin_user_company, role=self.admin_role)
+        )
+
+        self.assertEqual(self.create_role(self.admin, "viewer").status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_renamed_admin_role_revokes_access(self):
+        self.assertEqual(self.create_role(self.admin, "editor").status_code, status.HTTP_201_CREATED)
+
+        self.admin_role.role = "owner"
+        self.admin_role.save()
+
+        self.assertEqual(self.create_role(self.admin, "viewer").status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_assigned_admin_role_grants_access(self):
+        self.assertEqual(self.create_role(self.member, "editor").status_code, status.HTTP_403_FORBIDDEN)
+
+        user_company = UserCompany.objects.create(user=self.member, company=self.company)
+        UserCompanyRoleService.assign_role_to_user(user_company, self.admin_role)
+
+        self.assertEqual(self.create_role(self.member, "editor").status_code, status.HTTP_201_CREATED)
+
+    def test_deleted_role_is_not_served_from_cache(self):
+        role = RoleService.create_role("editor", company_id=self.company.pk)
+        self.assertEqual(get_role_by_pk(role.pk), role)
+
+        RoleService.soft_delete_role(role, company_id=self.company.pk)
+
+        self.assertIsNone(get_role_by_pk(role.pk))
@@ -0,0 +1,58 @@
+from django.urls import reverse
+
+from ..models import Permission, RolePermission
+from ..services import RolePermissionService
+from .base import AccessControlAPITestCase
+
+
+class RolePermissionBulkCreateTestCase(AccessControlAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.view = Permission.objects.create(code="roles.view", module="roles")
+        self.edit = Permission.objects.create(code="roles.edit", module="roles")
+
+    def bulk_assign(self, permission_ids):
+        return self.client.post(
+            reverse("role-permission-bulk-create"),
+            {"company": self.company.pk, "role": self.admin_role.pk, "permissions": permission_ids},
+            format="json",
+        )
+
+    def test_assigns_every_permission(self):
+        response = self.bulk_assign([self.view.pk, self.edit.pk])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["permissions"], [self.view.pk, self.edit.pk])
+        self.assertEqual(RolePermission.objects.filter(role=self.admin_role).count(), 2)
+
+    def test_reports_only_newly_assigned_permissions(self):
+        RolePermissionService.assign_permission_to_role(self.admin_role, self.view)
+
+        response = self.bulk_assign([self.view.pk, self.edit.pk])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["permissions"], [self.edit.pk])
+        self.assertEqual(RolePermission.objects.filter(role=self.admin_role).count(), 2)
+
+    def test_reassigns_a_removed_permission(self):
+        role_permission = RolePermissionService.assign_permission_to_role(self.admin_role, self.view)
+        RolePermissionService.remove_permission_from_role(role_permission)
+
+        response = self.bulk_assign([self.view.pk])
+
+        self.assertEqual(response.data["permissions"], [self.view.pk])
+        self.assertTrue(RolePermission.objects.filter(role=self.admin_role, permission=self.view).exists())
+
+    def test_unknown_permission_is_rejected(self):
+        response = self.bulk_assign([self.view.pk, 999999])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(RolePermission.objects.exists())
+
+    def test_requires_company_admin(self):
+        self.client.force_authenticate(self.member)
+
+        response = self.bulk_assign([self.view.pk])
+
+        self.assertEqual(response.status_code, 403)
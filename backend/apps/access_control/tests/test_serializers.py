@@ -0,0 +1,104 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from ..api.serializers import (
+    InvitationListSerializer,
+    InvitationSerializer,
+    PermissionListSerializer,
+    RoleListSerializer,
+    RolePermissionListSerializer,
+    RoleSerializer,
+)
+from ..models import Invitation, Permission, RolePermission
+from .base import AccessControlAPITestCase
+
+
+def integrity_error(**cause_attrs):
+    """IntegrityError chained from a driver error carrying the given attributes"""
+    try:
+        raise IntegrityError() from type("DriverError", (Exception,), cause_attrs)()
+    except IntegrityError as exc:
+        return exc
+
+
+class UniqueConstraintErrorTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.serializer = RoleSerializer()
+
+    def test_declared_constraint_is_mapped(self):
+        exc = integrity_error(pgcode="23505", diag=SimpleNamespace(constraint_name="uniq_active_company_role"))
+        self.assertTrue(self.serializer.is_unique_violation(exc))
+
+    def test_other_declared_unique_constraint_is_not_mapped(self):
+        exc = integrity_error(pgcode="23505", diag=SimpleNamespace(constraint_name="uniq_pending_token"))
+        self.assertFalse(InvitationSerializer().is_unique_violation(exc))
+
+    def test_undeclared_unique_index_is_mapped(self):
+        # Full unique index from the schema before the partial constraints
+        name = "access_control_role_company_id_role_1a2b3c4d_uniq"
+        exc = integrity_error(pgcode="23505", diag=SimpleNamespace(constraint_name=name))
+        self.assertTrue(self.serializer.is_unique_violation(exc))
+
+    def test_not_null_and_foreign_key_violations_are_not_mapped(self):
+        for pgcode in ("23502", "23503", "23514"):
+            exc = integrity_error(pgcode=pgcode, diag=SimpleNamespace(constraint_name=None))
+            self.assertFalse(self.serializer.is_unique_violation(exc), pgcode)
+
+
+class FlatRepresentationTestCase(AccessControlAPITestCase):
+    """Flat list representations match DRF's own field-by-field output"""
+
+    def setUp(self):
+        super().setUp()
+        permission = Permission.objects.create(code="roles.view", module="roles")
+        self.instances = {
+            RoleListSerializer: self.admin_role,
+            PermissionListSerializer: permission,
+            RolePermissionListSerializer: RolePermission.objects.create(
+                role=self.admin_role, permission=permission
+            ),
+            InvitationListSerializer: Invitation.objects.create(
+                company=self.company, email="new@example.com", role=self.admin_role,
+                expires_at=timezone.now() + timedelta(days=1), invited_by=self.admin,
+            ),
+        }
+
+    def get_context(self):
+        request = APIRequestFactory().get("/")
+        force_authenticate(request, self.admin)
+        return {"request": Request(request)}
+
+    def test_output_matches_plain_serializer(self):
+        for serializer_class, instance in self.instances.items():
+            with self.subTest(serializer_class.__name__):
+                serializer = serializer_class(context=self.get_context())
+                self.assertEqual(
+                    serializer.to_representation(instance),
+                    serializers.Serializer.to_representation(serializer, instance),
+                )
+
+    def test_field_coercion_is_kept(self):
+        serializer = PermissionListSerializer(context=self.get_context())
+        permission = Permission(code=123, module="roles")
+
+        self.assertEqual(serializer.to_representation(permission)["code"], "123")
+
+    def test_field_readers_are_resolved_once_per_list(self):
+        serializer = RoleListSerializer([self.admin_role] * 2, many=True, context=self.get_context())
+
+        with patch.object(
+            RoleListSerializer, "get_field_readers", autospec=True,
+            side_effect=RoleListSerializer.get_field_readers,
+        ) as get_field_readers:
+            self.assertEqual(len(serializer.data), 2)
+
+        get_field_readers.assert_called_once()
@@ -0,0 +1,85 @@
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Invitation, Permission, Role, RolePermission, UserCompany, UserCompanyRole
+from ..services import (
+    InvitationService,
+    PermissionService,
+    RolePermissionService,
+    RoleService,
+    UserCompanyRoleService,
+    UserCompanyService,
+)
+from .base import AccessControlAPITestCase
+
+
+class SoftDeleteRecreateTestCase(AccessControlAPITestCase):
+    """Unique constraints cover active rows only: a removed row never blocks a new one"""
+
+    def test_permission_code_is_reusable(self):
+        for _ in range(2):
+            permission = PermissionService.create_permission("reports.view", "reports")
+            PermissionService.soft_delete_permission(permission)
+
+        PermissionService.create_permission("reports.view", "reports")
+
+        self.assertEqual(Permission.all_objects.filter(code="reports.view").count(), 3)
+        self.assertEqual(Permission.objects.filter(code="reports.view").count(), 1)
+
+    def test_role_name_is_reusable(self):
+        for _ in range(2):
+            role = RoleService.create_role("editor", company_id=self.company.pk)
+            RoleService.soft_delete_role(role, company_id=self.company.pk)
+
+        RoleService.create_role("editor", company_id=self.company.pk)
+
+        self.assertEqual(Role.objects.filter(company=self.company, role="editor").count(), 1)
+
+    def test_role_permission_is_reassignable(self):
+        permission = Permission.objects.create(code="reports.view", module="reports")
+        for _ in range(2):
+            role_permission = RolePermissionService.assign_permission_to_role(self.admin_role, permission)
+            RolePermissionService.remove_permission_from_role(role_permission)
+
+        RolePermissionService.assign_permission_to_role(self.admin_role, permission)
+
+        self.assertEqual(
+            RolePermission.objects.filter(role=self.admin_role, permission=permission).count(), 1
+        )
+
+    def test_user_company_is_reassociable(self):
+        for _ in range(2):
+            user_company = UserCompanyService.associate_user_with_company(self.member, self.company)
+            UserCompanyService.remove_user_from_company(user_company)
+
+        UserCompanyService.associate_user_with_company(self.member, self.company)
+
+        self.assertEqual(UserCompany.objects.filter(user=self.member, company=self.company).count(), 1)
+
+    def test_user_company_role_is_reassignable_through_api_and_service(self):
+        role = Role.objects.create(company=self.company, role="manager")
+        user_company = UserCompany.objects.create(user=self.member, company=self.company)
+        payload = {"user_company": user_company.pk, "role": role.pk, "company": self.company.pk}
+
+        # Two API-created rows, each removed, leave two soft-deleted rows behind
+        for _ in range(2):
+            response = self.client.post(reverse("user-company-role-list-create"), payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            UserCompanyRoleService.remove_role_from_user(UserCompanyRole.objects.get(pk=response.data["id"]))
+
+        UserCompanyRoleService.assign_role_to_user(user_company, role)
+
+        self.assertEqual(UserCompanyRole.objects.filter(user_company=user_company, role=role).count(), 1)
+
+    def test_invitation_is_reissuable_after_revoke(self):
+        for _ in range(2):
+            invitation = InvitationService.create_invitation(
+                self.company, "new@example.com", self.admin_role, self.admin
+            )
+            InvitationService.revoke_invitation(invitation.pk, self.company.pk, self.admin)
+
+        InvitationService.create_invitation(self.company, "new@example.com", self.admin_role, self.admin)
+
+        self.assertEqual(
+            Invitation.objects.filter(company=self.company, email="new@example.com", status="pending").count(), 1
+        )
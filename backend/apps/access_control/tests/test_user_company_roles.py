@@ -0,0 +1,42 @@
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Role, UserCompany, UserCompanyRole
+from ..services.user_company_role_service import UserCompanyRoleService
+from .base import AccessControlAPITestCase
+
+
+class UserCompanyRoleAPITestCase(AccessControlAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.role = Role.objects.create(company=self.company, role="manager")
+        self.user_company = UserCompany.objects.create(user=self.member, company=self.company)
+        self.list_url = reverse("user-company-role-list-create")
+        self.payload = {
+            "user_company": self.user_company.id,
+            "role": self.role.id,
+            "company": self.company.id,
+        }
+
+    def test_reassign_after_remove(self):
+        response = self.client.post(self.list_url, self.payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        UserCompanyRoleService.remove_role_from_user(
+            UserCompanyRole.objects.get(pk=response.data["id"])
+        )
+
+        response = self.client.post(self.list_url, self.payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            UserCompanyRole.all_objects.filter(user_company=self.user_company, role=self.role).count(),
+            2,
+        )
+
+    def test_duplicate_active_assignment_is_rejected(self):
+        self.client.post(self.list_url, self.payload, format="json")
+
+        response = self.client.post(self.list_url, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,10 +1,28 @@
 # user_activity/admin.py
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from .models import ActivityLog, Notification, DateDim, SecurityAuditLog
 # from apps.identity.account.models.user import RoleChangeLog
 
+
+class NoCountPaginator(Paginator):
+    """Paginator that skips COUNT(*) on unbounded log tables"""
+
+    @cached_property
+    def count(self):
+        return 9999999
+
+
 admin.site.register(DateDim)
-admin.site.register(SecurityAuditLog)
+
+
+@admin.register(SecurityAuditLog)
+class SecurityAuditLogAdmin(admin.ModelAdmin):
+    # __str__ renders the user
+    list_select_related = ("user",)
+    paginator = NoCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(ActivityLog)
@@ -20,6 +38,9 @@ class ActivityLogAdmin(admin.ModelAdmin):
         "old_values",
         "new_values",
     )
+    list_select_related = ("user", "company", "date")
+    paginator = NoCountPaginator
+    show_full_result_count = False
     list_filter = ("action", "created_at")
     search_fields = ("user__username", "ip_address")
 
@@ -27,6 +48,7 @@ class ActivityLogAdmin(admin.ModelAdmin):
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ("user", "message", "read", "created_at")
+    list_select_related = ("user",)
     list_filter = ("read", "created_at")
     search_fields = ("user__username", "message")
 
@@ -25,7 +25,7 @@ class NotificationListSerializer(serializers.ModelSerializer):
 
 class ActivityLogSerializer(serializers.ModelSerializer):
     """Full activity log serializer."""
-    user_display = serializers.CharField(source="user.__str__", read_only=True)
+    user_display = serializers.CharField(source="user.username", read_only=True, default=None)
 
     class Meta:
         model = ActivityLog
@@ -48,7 +48,7 @@ class ActivityLogSerializer(serializers.ModelSerializer):
 
 class ActivityLogListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for listing activity logs."""
-    user_display = serializers.CharField(source="user.__str__", read_only=True)
+    user_display = serializers.CharField(source="user.username", read_only=True, default=None)
 
     class Meta:
         model = ActivityLog
@@ -64,7 +64,7 @@ class ActivityLogListSerializer(serializers.ModelSerializer):
 
 class SecurityAuditLogSerializer(serializers.ModelSerializer):
     """Security audit log serializer."""
-    user_display = serializers.CharField(source="user.__str__", read_only=True)
+    user_display = serializers.CharField(source="user.username", read_only=True, default=None)
 
     class Meta:
         model = SecurityAuditLog
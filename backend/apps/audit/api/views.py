@@ -1,7 +1,9 @@
 """
 Audit views — notifications, activity logs, and security audit logs.
 """
+from django.db.models import F
 from rest_framework.generics import ListAPIView
+from rest_framework.relations import RelatedField
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -18,22 +20,73 @@ from .serializers import (
     SecurityAuditLogSerializer,
 )
 from apps.access_control.permissions.IsAdminUser import IsAdminUser
+from apps.shared.pagination import WindowCountPageNumberPagination
+
+
+class ValuesListMixin:
+    """
+    Serve a list endpoint straight from ``.values()`` rows.
+
+    Skips model instantiation; each row is still formatted by the declared
+    serializer's fields, so the output matches the serializer's. Views list
+    the plain columns in ``values_fields`` and any computed ones in
+    ``values_expressions``, keyed by serializer field name.
+    """
+
+    values_fields = ()
+    values_expressions = {}
+
+    def get_row_formatters(self):
+        # Related fields expect an instance; the row already holds the pk
+        return [
+            (name, None if isinstance(field, RelatedField) else field.to_representation)
+            for name, field in self.get_serializer().fields.items()
+        ]
+
+    def format_rows(self, rows):
+        formatters = self.get_row_formatters()
+        return [
+            {
+                name: row[name] if to_representation is None or row[name] is None
+                else to_representation(row[name])
+                for name, to_representation in formatters
+            }
+            for row in rows
+        ]
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *self.values_fields, **self.values_expressions
+        )
+        page = self.paginate_queryset(queryset)
+        rows = self.format_rows(queryset if page is None else page)
+
+        if page is None:
+            return Response(rows)
+        return self.get_paginated_response(rows)
 
 
 # ==================== NOTIFICATION VIEWS ====================
 
-class NotificationListView(ListAPIView):
+class NotificationListView(ValuesListMixin, ListAPIView):
     """
     GET /notifications/ → list notifications for the authenticated user.
     Supports ?unread=true query param to filter unread only.
     """
     serializer_class = NotificationListSerializer
     permission_classes = [IsAuthenticated]
+    # Count and rows from one query, so they agree even if cached counts lag
+    pagination_class = WindowCountPageNumberPagination
+    values_fields = ("id", "message", "read", "created_at")
+
+    @property
+    def unread_only(self) -> bool:
+        unread_only = self.request.query_params.get("unread")
+        return bool(unread_only) and unread_only.lower() == "true"
 
     def get_queryset(self):
         qs = NotificationService.get_user_notifications(self.request.user)
-        unread_only = self.request.query_params.get("unread")
-        if unread_only and unread_only.lower() == "true":
+        if self.unread_only:
             qs = qs.filter(read=False)
         return qs
 
@@ -86,12 +139,14 @@ class NotificationMarkReadView(APIView):
 
 # ==================== ACTIVITY LOG VIEWS ====================
 
-class ActivityLogListView(ListAPIView):
+class ActivityLogListView(ValuesListMixin, ListAPIView):
     """
     GET /activity-logs/?company=<id> → list activity logs for a company (admin only).
     """
     serializer_class = ActivityLogListSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
+    values_fields = ("id", "entity_type", "action", "created_at")
+    values_expressions = {"user_display": F("user__username")}
 
     def get_queryset(self):
         company_id = self.request.query_params.get("company")
@@ -113,12 +168,14 @@ class ActivityLogDetailView(ListAPIView):
 
 # ==================== SECURITY AUDIT LOG VIEWS ====================
 
-class SecurityAuditLogListView(ListAPIView):
+class SecurityAuditLogListView(ValuesListMixin, ListAPIView):
     """
     GET /security-logs/ → user's own security audit logs.
     """
     serializer_class = SecurityAuditLogSerializer
     permission_classes = [IsAuthenticated]
+    values_fields = ("id", "user", "date", "action", "metadata", "ip_address", "created_at")
+    values_expressions = {"user_display": F("user__username")}
 
     def get_queryset(self):
         return SecurityAuditLogService.get_logs_for_user(self.request.user)
@@ -17,6 +17,12 @@ class Notification(models.Model):
     def __str__(self):
         return f"Notification for  {self.user.username}"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["user", "read"]),
+        ]
+
 
 # class ActivityLog(models.Model):
 #     user = models.ForeignKey(
@@ -90,7 +96,9 @@ class ActivityLog(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["company"]),
+            # Company and user listings filter on one and sort newest first
+            models.Index(fields=["company", "-created_at"]),
+            models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["entity_type", "entity_id"]),
         ]
         verbose_name = "Activity Log"
@@ -111,5 +119,8 @@ class SecurityAuditLog(models.Model):
         return f"{self.user} - {self.action}"
 
     class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+        ]
         verbose_name = "Security Audit Log"
         verbose_name_plural = "Security Audit Logs"
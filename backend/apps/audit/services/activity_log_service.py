@@ -17,14 +17,14 @@ class ActivityLogService:
         """Get activity logs for a company, newest first."""
         return ActivityLog.objects.filter(
             company_id=company_id,
-        ).select_related("user", "date").order_by("-created_at")
+        ).select_related("user").order_by("-created_at")
 
     @staticmethod
     def get_activity_logs_for_user(user) -> QuerySet:
         """Get activity logs for a specific user."""
         return ActivityLog.objects.filter(
             user=user,
-        ).select_related("company", "date").order_by("-created_at")
+        ).select_related("user").order_by("-created_at")
 
     @staticmethod
     def log_activity(
@@ -50,5 +50,26 @@ class ActivityLogService:
             new_values=new_values,
             ip_address=ip_address,
         )
-        logger.info(f"Activity logged: {action} by {user} on {entity_type}:{entity_id}")
+        logger.info("Activity logged: %s by %s on %s:%s", action, user, entity_type, entity_id)
         return log
+
+    @staticmethod
+    def log_activity_bulk(entries: list) -> list:
+        """
+        Log many activities with batched INSERTs.
+
+        Args:
+            entries: ActivityLog instances, or dicts of ActivityLog fields
+
+        Returns:
+            List of created ActivityLog instances
+        """
+        logs = [
+            entry if isinstance(entry, ActivityLog) else ActivityLog(**entry)
+            for entry in entries
+        ]
+        if not logs:
+            return []
+        created = ActivityLog.objects.bulk_create(logs, batch_size=500)
+        logger.info("%s activities logged", len(created))
+        return created
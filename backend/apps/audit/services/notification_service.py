@@ -2,12 +2,17 @@
 Notification Service — business logic for notifications.
 """
 import logging
-from django.db.models import QuerySet
+from django.core.cache import cache
+from django.db.models import Count, Q, QuerySet
 from apps.shared.services.email_service import send_email
 from ..models import Notification
 
 logger = logging.getLogger(__name__)
 
+# Counts are invalidated on every write through this service; the
+# timeout only bounds staleness from writes made elsewhere (e.g. admin)
+NOTIFICATION_COUNTS_CACHE_TIMEOUT = 300
+
 
 class NotificationService:
     """Service for notification operations."""
@@ -20,15 +25,38 @@ class NotificationService:
     @staticmethod
     def get_unread_count(user) -> int:
         """Get count of unread notifications."""
-        return Notification.objects.filter(user=user, read=False).count()
+        return NotificationService.get_notification_counts(user)["unread"]
 
     @staticmethod
-    def mark_as_read(notification_id: int, user) -> Notification:
-        """Mark a single notification as read."""
-        notification = Notification.objects.get(id=notification_id, user=user)
-        notification.read = True
-        notification.save(update_fields=["read"])
-        return notification
+    def get_notification_counts(user) -> dict:
+        """Get total and unread notification counts, cached per user."""
+        return cache.get_or_set(
+            f"notif:counts:{user.pk}",
+            lambda: Notification.objects.filter(user=user).aggregate(
+                total=Count("id"),
+                unread=Count("id", filter=Q(read=False)),
+            ),
+            NOTIFICATION_COUNTS_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def invalidate_counts(user) -> None:
+        """Drop the user's cached notification counts."""
+        cache.delete(f"notif:counts:{user.pk}")
+
+    @staticmethod
+    def mark_as_read(notification_id: int, user) -> int:
+        """
+        Mark a single notification as read with one UPDATE (no fetch).
+        Returns 1 if it was unread, 0 if it was already read.
+        """
+        notifications = Notification.objects.filter(id=notification_id, user=user)
+        updated = notifications.filter(read=False).update(read=True)
+        if updated:
+            NotificationService.invalidate_counts(user)
+        elif not notifications.exists():
+            raise Notification.DoesNotExist("Notification matching query does not exist.")
+        return updated
 
     @staticmethod
     def mark_all_read(user) -> int:
@@ -36,7 +64,9 @@ class NotificationService:
         count = Notification.objects.filter(
             user=user, read=False
         ).update(read=True)
-        logger.info(f"Marked {count} notifications as read for user {user}")
+        if count:
+            NotificationService.invalidate_counts(user)
+        logger.info("Marked %s notifications as read for user %s", count, user)
         return count
 
     @staticmethod
@@ -45,6 +75,7 @@ class NotificationService:
             user=user,
             message=message
         )
+        NotificationService.invalidate_counts(user)
         # email notification
         if user.email:
             try:
@@ -17,7 +17,7 @@ class SecurityAuditLogService:
         """Get security audit logs for a specific user, newest first."""
         return SecurityAuditLog.objects.filter(
             user=user,
-        ).select_related("date").order_by("-created_at")
+        ).order_by("-created_at")
 
     @staticmethod
     def log_security_event(
@@ -0,0 +1,131 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.identity.account.models import CustomUser
+from apps.company.models import Company
+from .api.serializers import NotificationListSerializer, SecurityAuditLogSerializer
+from .models import ActivityLog, DateDim, Notification, SecurityAuditLog
+from .services import ActivityLogService, NotificationService
+
+
+class AuditTestCase(APITestCase):
+    """User, company and today's DateDim row shared by the audit tests"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create(
+            username="auditor", primary_mobile="+201000000010", email="auditor@example.com", account_uid="A1"
+        )
+        self.company = Company.objects.create(name="Audited", create_by=self.user)
+        today = date.today()
+        self.date_dim = DateDim.objects.create(
+            id=int(today.strftime("%Y%m%d")), full_date=today, day=today.day,
+            day_name=today.strftime("%A"), day_of_week=today.isoweekday(),
+            day_of_year=today.timetuple().tm_yday, week_of_year=today.isocalendar()[1],
+            iso_week=today.isocalendar()[1], month=today.month, month_name=today.strftime("%B"),
+            quarter=(today.month - 1) // 3 + 1, year=today.year, is_weekend=today.isoweekday() > 5,
+            fiscal_month=today.month, fiscal_quarter=(today.month - 1) // 3 + 1, fiscal_year=today.year,
+        )
+        self.client.force_authenticate(self.user)
+
+    def log(self, entity_id=1, user=None, **kwargs):
+        return ActivityLogService.log_activity(
+            user=user or self.user, company=self.company, date_dim=self.date_dim,
+            entity_type="role", entity_id=entity_id, action="update", **kwargs
+        )
+
+
+class ActivityLogServiceTestCase(AuditTestCase):
+
+    def test_log_activity_writes_immediately(self):
+        log = self.log()
+
+        self.assertIsNotNone(log.pk)
+        self.assertTrue(ActivityLog.objects.filter(pk=log.pk).exists())
+
+    def test_log_activity_bulk_writes_all_entries(self):
+        entries = [
+            {"user": self.user, "company": self.company, "date": self.date_dim,
+             "entity_type": "role", "entity_id": entity_id, "action": "update"}
+            for entity_id in range(3)
+        ]
+
+        with self.assertNumQueries(1):
+            ActivityLogService.log_activity_bulk(entries)
+
+        self.assertEqual(ActivityLog.objects.count(), 3)
+
+
+class NotificationListTestCase(AuditTestCase):
+
+    def test_count_matches_rows_after_writes_that_skip_invalidation(self):
+        NotificationService.create_notification(self.user, "first")
+        self.client.get(reverse("notification-list"))  # warm the cached counts
+
+        Notification.objects.create(user=self.user, message="second")
+        response = self.client.get(reverse("notification-list"))
+
+        self.assertEqual(response.data["results"]["count"], 2)
+        self.assertEqual(len(response.data["results"]["results"]), 2)
+
+    def test_unread_filter_counts_only_unread(self):
+        Notification.objects.create(user=self.user, message="read", read=True)
+        Notification.objects.create(user=self.user, message="unread")
+
+        response = self.client.get(reverse("notification-list"), {"unread": "true"})
+
+        self.assertEqual(response.data["results"]["count"], 1)
+        self.assertEqual(response.data["results"]["results"][0]["message"], "unread")
+
+    def test_page_past_the_end_is_not_found(self):
+        Notification.objects.create(user=self.user, message="only")
+
+        response = self.client.get(reverse("notification-list"), {"page": 2})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class ValuesListOutputTestCase(AuditTestCase):
+    """The .values() list views render exactly what their serializers would"""
+
+    def test_notification_rows_match_serializer(self):
+        Notification.objects.create(user=self.user, message="hello")
+
+        response = self.client.get(reverse("notification-list"))
+
+        expected = NotificationListSerializer(Notification.objects.all(), many=True).data
+        self.assertEqual(response.data["results"]["results"], expected)
+
+    def test_security_log_rows_match_serializer(self):
+        SecurityAuditLog.objects.create(
+            user=self.user, date=self.date_dim, action="login",
+            metadata={"device": "web"}, ip_address="10.0.0.1",
+        )
+        SecurityAuditLog.objects.create(user=self.user, date=self.date_dim, action="logout")
+
+        response = self.client.get(reverse("security-log-list"))
+
+        logs = SecurityAuditLog.objects.order_by("-created_at")
+        expected = SecurityAuditLogSerializer(logs, many=True).data
+        self.assertEqual(response.data["results"], expected)
+
+
+class NotificationServiceTestCase(AuditTestCase):
+
+    def test_mark_as_read_reports_whether_it_changed_the_row(self):
+        notification = Notification.objects.create(user=self.user, message="hello")
+
+        self.assertEqual(NotificationService.mark_as_read(notification.pk, self.user), 1)
+        self.assertEqual(NotificationService.mark_as_read(notification.pk, self.user), 0)
+
+    def test_mark_as_read_raises_for_another_users_notification(self):
+        other = CustomUser.objects.create(
+            username="other", primary_mobile="+201000000011", email="other@example.com", account_uid="A2"
+        )
+        notification = Notification.objects.create(user=other, message="hello")
+
+        with self.assertRaises(Notification.DoesNotExist):
+            NotificationService.mark_as_read(notification.pk, self.user)
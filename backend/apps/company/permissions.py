@@ -46,7 +46,7 @@ class IsCompanyAdmin(BasePermission):
                 user_company__company_id=company_id,
                 user_company__is_active=True,
                 user_company__is_deleted=False,
-                role__role__iexact="admin",
+                role__role="admin",
                 role__is_deleted=False,
                 is_deleted=False,
             ).exists()
@@ -61,7 +61,7 @@ class IsCompanyAdmin(BasePermission):
                 user_company__company_id=obj.id,
                 user_company__is_active=True,
                 user_company__is_deleted=False,
-                role__role__iexact="admin",
+                role__role="admin",
                 role__is_deleted=False,
                 is_deleted=False,
             ).exists()
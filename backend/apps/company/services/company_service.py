@@ -94,7 +94,7 @@ class CompanyService:
             user_company__company_id=company_id,
             user_company__is_active=True,
             user_company__is_deleted=False,
-            role__role__iexact="admin",
+            role__role="admin",
             role__is_deleted=False,
             is_deleted=False,
         ).exists()
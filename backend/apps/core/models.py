@@ -9,6 +9,13 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class ActiveManager(models.Manager):
+    """Manager that hides soft-deleted rows"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class SoftDeleteModel(models.Model):
     deleted_at = models.DateTimeField(blank=True, null=True)
     is_deleted = models.BooleanField(default=False)
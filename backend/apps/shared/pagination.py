@@ -0,0 +1,58 @@
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db.models import Count, Window
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination, newest first.
+
+    Each page is a range scan on created_at (indexed on the paginated
+    models) instead of an OFFSET that reads and discards earlier rows.
+    """
+
+    ordering = ("-created_at", "-id")
+
+
+class WindowCountPaginator(Paginator):
+    """
+    Paginator that reads the total from the page query itself.
+
+    The page rows carry ``COUNT(*) OVER ()``, so the count and the rows come
+    from one statement and always agree. Only an empty page pays for a
+    separate COUNT(*), to tell "no rows" from "page out of range".
+    """
+
+    total_alias = "_window_total"
+
+    def page(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+
+        bottom = (number - 1) * self.per_page
+        rows = list(
+            self.object_list.annotate(**{self.total_alias: Window(Count("pk"))})[
+                bottom:bottom + self.per_page
+            ]
+        )
+        if not rows:
+            # Out of range, or an empty list: the regular path decides
+            return super().page(number)
+
+        for row in rows:
+            if isinstance(row, dict):
+                self.count = row.pop(self.total_alias)
+            else:
+                self.count = getattr(row, self.total_alias)
+        return self._get_page(rows, number, self)
+
+
+class WindowCountPageNumberPagination(PageNumberPagination):
+    """Page-number pagination whose count comes from the page query"""
+
+    django_paginator_class = WindowCountPaginator
@@ -0,0 +1,24 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Dicts, lists, strings and numbers are encoded in compiled code; datetimes
+    and anything orjson does not know natively (lazy translations, Decimals,
+    ...) are handed to DRF's JSONEncoder so the output matches JSONRenderer.
+    """
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME,
+        )
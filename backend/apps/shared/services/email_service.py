@@ -1,11 +1,29 @@
+import atexit
 import logging
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from django.core.mail import send_mail
 from django.conf import settings
 from django.core.mail import BadHeaderError
+from django.db import transaction
 
 
 logger = logging.getLogger(__name__)
 
+# Background senders for send_email_async; SMTP round-trips stay off request threads.
+# The queue lives in the worker process: it is drained on graceful shutdown
+# (drain_email_queue), but a killed worker loses queued mails and failed
+# sends are not retried. A durable task queue would be needed for that.
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="email")
+
+
+def drain_email_queue() -> None:
+    """Block until every queued email has been sent (or has failed)."""
+    _email_executor.shutdown(wait=True)
+
+
+atexit.register(drain_email_queue)
+
 
 def send_email(subject: str, message: str, recipient_email: str) -> bool:
     """
@@ -20,13 +38,31 @@ def send_email(subject: str, message: str, recipient_email: str) -> bool:
             fail_silently=False
         )
 
-        logger.info(f"Email sent successfully to {recipient_email}")
+        logger.info("Email sent successfully to %s", recipient_email)
         return True
 
     except BadHeaderError:
         logger.error("Invalid header found while sending email.")
         return False
 
+
+def _send_email_logged(subject: str, message: str, recipient_email: str) -> None:
+    try:
+        send_email(subject, message, recipient_email)
+    except (smtplib.SMTPException, OSError) as e:
+        logger.error("Failed to send email to %s: %s", recipient_email, e)
+
+
+def send_email_async(subject: str, message: str, recipient_email: str) -> None:
+    """
+    Send an email in the background once the current transaction commits.
+    Failures are logged, never raised to the caller.
+    """
+    transaction.on_commit(
+        lambda: _email_executor.submit(_send_email_logged, subject, message, recipient_email)
+    )
+
+
 def send_password_reset_email(email: str, reset_link: str) -> bool:
     """
     Sent password reset email
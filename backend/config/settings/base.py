@@ -122,6 +122,25 @@ SIMPLE_JWT = {
 }
 
 
+# === CACHE ===
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # === SESSION ===
 
 SESSION_COOKIE_AGE = 30 * 60
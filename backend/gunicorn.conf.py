@@ -7,3 +7,10 @@ accesslog = "-"
 errorlog = "-"
 loglevel = "debug"
 capture_output = True
+
+
+def worker_exit(server, worker):
+    # Send the emails still queued in this worker before it goes away
+    from apps.shared.services.email_service import drain_email_queue
+
+    drain_email_queue()